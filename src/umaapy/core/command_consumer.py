@@ -88,13 +88,13 @@ class CommandConsumer(dds.DataWriterListener):
         super().__init__()
         self.source_id: IdentifierType = source_id
 
-        if not validate_umaa_obj(command_type(), UMAAConcept.COMMAND):
+        if not validate_umaa_obj(command_type, UMAAConcept.COMMAND):
             raise RuntimeError(f"'{command_type.__name__.split('_')[-1]}' is not a valid UMAA command.")
-        if not validate_umaa_obj(ack_type(), UMAAConcept.ACKNOWLEDGEMENT):
+        if not validate_umaa_obj(ack_type, UMAAConcept.ACKNOWLEDGEMENT):
             raise RuntimeError(f"'{ack_type.__name__.split('_')[-1]}' is not a valid UMAA acknowledgement.")
-        if not validate_umaa_obj(status_type(), UMAAConcept.STATUS):
+        if not validate_umaa_obj(status_type, UMAAConcept.STATUS):
             raise RuntimeError(f"'{status_type.__name__.split('_')[-1]}' is not a valid UMAA status.")
-        if execution_status_type and not validate_umaa_obj(execution_status_type(), UMAAConcept.EXECUTION_STATUS):
+        if execution_status_type and not validate_umaa_obj(execution_status_type, UMAAConcept.EXECUTION_STATUS):
             raise RuntimeError(f"'{execution_status_type.__name__.split('_')[-1]}' is not a valid UMAA exec status.")
 
         self.name = command_type.__name__.split("CommandType")[0].split("_")[-1] + self.__class__.__name__
@@ -188,7 +188,8 @@ class CommandConsumer(dds.DataWriterListener):
             return None
 
         command.source = self.source_id
-        command.destination = provider_id
+        # Always hand the sample a real IdentifierType, even if the caller passed a provider's hashable key
+        command.destination = provider.source.to_umaa()
         session = CommandSession(self, command)
         provider.sessions[session._session_id] = session
         self._providers_by_session[session._session_id] = provider
@@ -301,13 +302,13 @@ class CommandConsumer(dds.DataWriterListener):
         for ack in reader.take_data():
             provider: Optional[Provider] = self._providers_by_source.get(HashableIdentifierType(ack.source), None)
             if provider is None:
-                self._logger.debug(f"Ack received from unknown provider with ID: {ack.source}")
+                self._logger.debug("Ack received from unknown provider with ID: %s", ack.source)
                 continue
 
             session: Optional[CommandSession] = provider.sessions.get(HashableNumericGUID(ack.sessionID), None)
 
             if session is None:
-                self._logger.debug(f"Ack received references an unknown session on {provider}")
+                self._logger.debug("Ack received references an unknown session on %s", provider)
 
             session._handle_ack(ack)
 
@@ -315,13 +316,13 @@ class CommandConsumer(dds.DataWriterListener):
         for status in reader.take_data():
             provider: Optional[Provider] = self._providers_by_source.get(HashableIdentifierType(status.source), None)
             if provider is None:
-                self._logger.debug(f"Status received from unknown provider with ID: {status.source}")
+                self._logger.debug("Status received from unknown provider with ID: %s", status.source)
                 continue
 
             session: Optional[CommandSession] = provider.sessions.get(HashableNumericGUID(status.sessionID), None)
 
             if session is None:
-                self._logger.debug(f"Status received references an unknown session on {provider}")
+                self._logger.debug("Status received references an unknown session on %s", provider)
 
             session._handle_status(status)
 
@@ -332,7 +333,7 @@ class CommandConsumer(dds.DataWriterListener):
             )
             if provider is None:
                 self._logger.debug(
-                    f"Execution status received from unknown provider with ID: {execution_status.source}"
+                    "Execution status received from unknown provider with ID: %s", execution_status.source
                 )
                 continue
 
@@ -341,7 +342,7 @@ class CommandConsumer(dds.DataWriterListener):
             )
 
             if session is None:
-                self._logger.debug(f"Execution status received references an unknown session on {provider}")
+                self._logger.debug("Execution status received references an unknown session on %s", provider)
 
             session._handle_status(execution_status)
 
@@ -353,7 +354,9 @@ class CommandConsumer(dds.DataWriterListener):
                 filter_components.append(f"{prefix} AND sessionID = &hex({guid_to_hex(sid.to_umaa())})")
 
         self._logger.debug(
-            f"Updating content filter expression for {len(filter_components)} sessions across {len(self._providers_by_source)} providers."
+            "Updating content filter expression for %s sessions across %s providers.",
+            len(filter_components),
+            len(self._providers_by_source),
         )
         reader_filter: dds.Filter = dds.Filter(" OR ".join(filter_components) if len(filter_components) else "1 = 0")
         self._ack_cft.set_filter(reader_filter)
@@ -45,8 +45,8 @@ class CommandProvider(dds.DataReaderListener):
         self._cmd_factory = cmd_factory
         self._cmd_priority = cmd_priority
 
-        # Validate command type by instantiating and checking UMAA compliance
-        if not validate_umaa_obj(cmd_type(), UMAAConcept.COMMAND):
+        # Validate command type against UMAA compliance
+        if not validate_umaa_obj(cmd_type, UMAAConcept.COMMAND):
             raise RuntimeError(f"'{cmd_type.__name__.split('_')[-1]}' is not a valid UMAA command.")
         self._cmd_type: Type = cmd_type
 
@@ -33,7 +33,7 @@ class ReportConsumer(dds.DataReaderListener):
     ):
         super().__init__()
         # Ensure the report type adheres to UMAA specifications
-        if not validate_umaa_obj(report_type(), UMAAConcept.REPORT):
+        if not validate_umaa_obj(report_type, UMAAConcept.REPORT):
             raise RuntimeError(f"'{report_type.__name__.split('_')[-1]}' is not a valid UMAA report.")
 
         # Store configuration
@@ -36,7 +36,7 @@ class ReportProvider(dds.DataWriterListener):
     ):
         super().__init__()
         # Validate that the data type adheres to UMAA report specifications
-        if not validate_umaa_obj(data_type(), UMAAConcept.REPORT):
+        if not validate_umaa_obj(data_type, UMAAConcept.REPORT):
             raise RuntimeError(f"'{data_type.__name__.split('_')[-1]}' is not a valid UMAA report.")
         # Store configuration
         self._source_id: UMAA_Common_IdentifierType = source
@@ -311,7 +311,7 @@ class CommandSession:
     def _handle_status(self, status: Any) -> None:
         with self._lock:
             if not self.is_started():
-                self._logger.debug(f"Status received while session is not started: {status.commandStatus}.")
+                self._logger.debug("Status received while session is not started: %s.", status.commandStatus)
                 return
             self._state = status.commandStatus
             self._reason = status.commandStatusReason
@@ -322,7 +322,7 @@ class CommandSession:
 
     def _handle_execution_status(self, execution_status: Any) -> None:
         if not self.is_started():
-            self._logger.debug(f"Execution status received while session is not started.")
+            self._logger.debug("Execution status received while session is not started.")
             return
         for execution_status_cb in self._execution_status_callbacks:
             get_event_processor().submit(execution_status_cb, execution_status)
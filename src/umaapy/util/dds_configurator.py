@@ -7,7 +7,7 @@ import inspect
 
 from umaapy.util.umaa_utils import (
     topic_from_type,
-    classify_obj_by_umaa,
+    classify_type_by_umaa,
     UMAAConcept,
     get_specializations_from_generalization,
     infer_umaa_key_fields,
@@ -340,8 +340,8 @@ class DDSConfigurator:
             inst.__init__(inst._domain_id, inst._qos_file)
 
     def _mt_classify_type(self, umaa_type: Type) -> Dict[Tuple[str, ...], Any]:
-        """Return the classification map for a default-constructed instance."""
-        return classify_obj_by_umaa(umaa_type())
+        """Return the (cached) classification map for a default-constructed instance."""
+        return classify_type_by_umaa(umaa_type)
 
     @staticmethod
     def _attr_base_from_metadata(field_name: str) -> Optional[str]:
@@ -126,11 +126,13 @@ class ReaderNode:
         """Register a decorator under a role (e.g., 'gen_spec', 'waypoints')."""
         if role in self._decorators:
             _logger.debug(
-                f"Replacing decorator for role {role}: "
-                f"{type(self._decorators[role]).__name__} -> {type(decorator).__name__}"
+                "Replacing decorator for role %s: %s -> %s",
+                role,
+                type(self._decorators[role]).__name__,
+                type(decorator).__name__,
             )
         decorator.name = role
-        _logger.debug(f"Registering decorator {decorator.name} for role {role}")
+        _logger.debug("Registering decorator %s for role %s", decorator.name, role)
         self._decorators[role] = decorator
 
         # If children were already attached for this role, wire them now.
@@ -199,7 +201,7 @@ class ReaderNode:
         for sample, info in self.reader.take():
             if info is not None and hasattr(info, "valid") and not info.valid:
                 # dispose/unregister/etc.: bubble info upward with no combined
-                _logger.debug(f"Received invalid sample: {type(sample)}, info: {info}")
+                _logger.debug("Received invalid sample: %s, info: %s", type(sample), info)
                 if self.parent_notify is not None:
                     if sample is None:
                         key = object()  # synthetic key for disposals
@@ -220,9 +222,12 @@ class ReaderNode:
                 combined = CombinedSample(base=sample)
                 self._combined_by_key[key] = combined
 
-            _logger.debug(f"Forwarding {type(sample).__name__.split('_')[-1]} to {len(self._decorators)} decorators")
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "Forwarding %s to %s decorators", type(sample).__name__.split("_")[-1], len(self._decorators)
+                )
             for deco in list(self._decorators.values()):
-                _logger.debug(f"Calling decorator {deco.name}")
+                _logger.debug("Calling decorator %s", deco.name)
                 try:
                     for sig in deco.on_reader_data(self, key, combined, sample):
                         if sig.complete and self.parent_notify is not None:
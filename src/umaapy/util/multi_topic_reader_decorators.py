@@ -72,7 +72,7 @@ class GenSpecReader(ReaderDecorator):
     def on_reader_data(
         self, node: ReaderNode, key: Any, combined: CombinedSample, sample: Any
     ) -> Iterable[AssemblySignal]:
-        _logger.debug(f"Received new {node.reader.type_name}")
+        _logger.debug("Received new %s", node.reader.type_name)
 
         gen_obj = get_at_path(sample, self.attr_path) if self.attr_path else sample
         topic, sid, sts = self._gen_binding(gen_obj)
@@ -102,11 +102,14 @@ class GenSpecReader(ReaderDecorator):
     def on_child_assembled(
         self, node: ReaderNode, child_name: str, key: Any, assembled: CombinedSample
     ) -> Iterable[AssemblySignal]:
-        _logger.debug(f"Received new {node.reader.type_name}")
-        try:
-            _logger.debug(f"[GenSpecReader] child '{child_name}' collections keys={list(assembled.collections.keys())}")
-        except Exception:
-            pass
+        _logger.debug("Received new %s", node.reader.type_name)
+        if _logger.isEnabledFor(logging.DEBUG):
+            try:
+                _logger.debug(
+                    "[GenSpecReader] child '%s' collections keys=%s", child_name, list(assembled.collections.keys())
+                )
+            except Exception:
+                pass
         spec = assembled.base
         sid, sts = self._spec_binding(spec)
         sid_k = guid_key(sid)
@@ -175,7 +178,8 @@ class LargeSetReader(ReaderDecorator):
         return getattr(elem, "setID"), getattr(elem, "elementID"), getattr(elem, "elementTimestamp")
 
     def on_reader_data(self, node, key, combined, sample):
-        _logger.debug(f"[LargeSetReader:{self.set_name}] on_reader_data: sample={type(sample).__name__}")
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("[LargeSetReader:%s] on_reader_data: sample=%s", self.set_name, type(sample).__name__)
         set_id, upd_id, upd_ts = self._meta_ids(sample)
         size = self._set_size(sample)
 
@@ -193,7 +197,7 @@ class LargeSetReader(ReaderDecorator):
             if not bucket:
                 combined.collections[self.set_name] = []
                 node._combined_by_key[key] = combined
-                _logger.debug(f"[LargeSetReader:{self.set_name}] complete empty (no elements)")
+                _logger.debug("[LargeSetReader:%s] complete empty (no elements)", self.set_name)
                 return (AssemblySignal(key, complete=True),)
 
         if size > 0:
@@ -221,13 +225,16 @@ class LargeSetReader(ReaderDecorator):
 
         combined.collections[self.set_name] = views
         node._combined_by_key[key] = combined
-        _logger.debug(f"[LargeSetReader:{self.set_name}] complete size>0 with {len(views)} elements (size={size})")
+        _logger.debug("[LargeSetReader:%s] complete size>0 with %s elements (size=%s)", self.set_name, len(views), size)
         return (AssemblySignal(key, complete=True),)
 
     def on_child_assembled(self, node, child_name, key, assembled):
-        _logger.debug(
-            f"[LargeSetReader:{self.set_name}] on_child_assembled: collections={list(assembled.collections.keys())}"
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "[LargeSetReader:%s] on_child_assembled: collections=%s",
+                self.set_name,
+                list(assembled.collections.keys()),
+            )
         elem = assembled.base
         set_id, elem_id, elem_ts = self._elem_ids(elem)
 
@@ -259,7 +266,7 @@ class LargeSetReader(ReaderDecorator):
             if not bucket:
                 comb.collections[self.set_name] = []
                 node._combined_by_key[parent_key] = comb
-                _logger.debug(f"[LargeSetReader:{self.set_name}] complete empty on child (no elements)")
+                _logger.debug("[LargeSetReader:%s] complete empty on child (no elements)", self.set_name)
                 return (AssemblySignal(parent_key, complete=True),)
 
         if size > 0:
@@ -286,7 +293,9 @@ class LargeSetReader(ReaderDecorator):
 
         comb.collections[self.set_name] = views
         node._combined_by_key[parent_key] = comb
-        _logger.debug(f"[LargeSetReader:{self.set_name}] complete on child with {len(views)} elements (size={size})")
+        _logger.debug(
+            "[LargeSetReader:%s] complete on child with %s elements (size=%s)", self.set_name, len(views), size
+        )
         return (AssemblySignal(parent_key, complete=True),)
 
 
@@ -344,7 +353,8 @@ class LargeListReader(ReaderDecorator):
         return ordered
 
     def on_reader_data(self, node, key, combined, sample):
-        _logger.debug(f"[LargeListReader:{self.list_name}] on_reader_data: sample={type(sample).__name__}")
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("[LargeListReader:%s] on_reader_data: sample=%s", self.list_name, type(sample).__name__)
         list_id, start_id, upd_id, upd_ts = self._meta_ids(sample)
         size = self._list_size(sample)
 
@@ -359,7 +369,11 @@ class LargeListReader(ReaderDecorator):
         comb_bucket = self._elem_combined_by_list.get(list_k, {})
 
         _logger.debug(
-            f"[LargeListReader:{self.list_name}] metadata: size={size}, bucket_size={len(bucket)}, start_k={start_k}"
+            "[LargeListReader:%s] metadata: size=%s, bucket_size=%s, start_k=%s",
+            self.list_name,
+            size,
+            len(bucket),
+            start_k,
         )
 
         # Check if we can complete the list now
@@ -367,7 +381,7 @@ class LargeListReader(ReaderDecorator):
             # Empty list case - can complete immediately
             combined.collections[self.list_name] = []
             node._combined_by_key[key] = combined
-            _logger.debug(f"[LargeListReader:{self.list_name}] complete empty (no elements)")
+            _logger.debug("[LargeListReader:%s] complete empty (no elements)", self.list_name)
             return (AssemblySignal(key, complete=True),)
 
         # For non-empty lists, check if we already have all elements
@@ -387,15 +401,20 @@ class LargeListReader(ReaderDecorator):
 
                 combined.collections[self.list_name] = views
                 node._combined_by_key[key] = combined
-                _logger.debug(f"[LargeListReader:{self.list_name}] complete with {len(views)} elements from metadata")
+                _logger.debug(
+                    "[LargeListReader:%s] complete with %s elements from metadata", self.list_name, len(views)
+                )
                 return (AssemblySignal(key, complete=True),)
 
         # If we can't complete yet, wait for more elements
-        _logger.debug(f"[LargeListReader:{self.list_name}] waiting for more elements or metadata")
+        _logger.debug("[LargeListReader:%s] waiting for more elements or metadata", self.list_name)
         return ()
 
     def on_child_assembled(self, node, child_name, key, assembled):
-        _logger.debug(f"[LargeListReader:{self.list_name}] on_child_assembled: element={type(assembled.base).__name__}")
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "[LargeListReader:%s] on_child_assembled: element=%s", self.list_name, type(assembled.base).__name__
+            )
         elem = assembled.base
         list_id, elem_id, _next_id, elem_ts = self._elem_ids(elem)
 
@@ -408,12 +427,16 @@ class LargeListReader(ReaderDecorator):
         comb_bucket[elem_k] = assembled
 
         _logger.debug(
-            f"[LargeListReader:{self.list_name}] stored element: list_k={list_k}, elem_k={elem_k}, bucket_size={len(bucket)}"
+            "[LargeListReader:%s] stored element: list_k=%s, elem_k=%s, bucket_size=%s",
+            self.list_name,
+            list_k,
+            elem_k,
+            len(bucket),
         )
 
         parent_sample = self._meta_by_list.get(list_k)
         if parent_sample is None:
-            _logger.debug(f"[LargeListReader:{self.list_name}] no parent metadata found for list_k={list_k}")
+            _logger.debug("[LargeListReader:%s] no parent metadata found for list_k=%s", self.list_name, list_k)
             return ()
 
         _, start_id, upd_id, upd_ts = self._meta_ids(parent_sample)
@@ -421,48 +444,55 @@ class LargeListReader(ReaderDecorator):
 
         parent_key = self._parent_key_by_list.get(list_k)
         if parent_key is None:
-            _logger.debug(f"[LargeListReader:{self.list_name}] no parent key found for list_k={list_k}")
+            _logger.debug("[LargeListReader:%s] no parent key found for list_k=%s", self.list_name, list_k)
             return ()
 
         comb = node._combined_by_key.get(parent_key)
         if comb is None:
-            _logger.debug(f"[LargeListReader:{self.list_name}] no combined sample found for parent_key={parent_key}")
+            _logger.debug("[LargeListReader:%s] no combined sample found for parent_key=%s", self.list_name, parent_key)
             return ()
 
         start_k = guid_key(start_id) if start_id is not None else None
 
         _logger.debug(
-            f"[LargeListReader:{self.list_name}] checking completion: size={size}, bucket_size={len(bucket)}, start_k={start_k}"
+            "[LargeListReader:%s] checking completion: size=%s, bucket_size=%s, start_k=%s",
+            self.list_name,
+            size,
+            len(bucket),
+            start_k,
         )
 
         if size == 0:
             if not bucket:
                 comb.collections[self.list_name] = []
                 node._combined_by_key[parent_key] = comb
-                _logger.debug(f"[LargeListReader:{self.list_name}] complete empty (no elements)")
+                _logger.debug("[LargeListReader:%s] complete empty (no elements)", self.list_name)
                 return (AssemblySignal(parent_key, complete=True),)
 
         if size > 0:
             if len(bucket) < size or start_k is None:
                 _logger.debug(
-                    f"[LargeListReader:{self.list_name}] waiting for more elements: have={len(bucket)}, need={size}"
+                    "[LargeListReader:%s] waiting for more elements: have=%s, need=%s",
+                    self.list_name,
+                    len(bucket),
+                    size,
                 )
                 return ()
         else:
             if upd_id is None or not guid_equal(upd_id, elem_id):
-                _logger.debug(f"[LargeListReader:{self.list_name}] update marker mismatch")
+                _logger.debug("[LargeListReader:%s] update marker mismatch", self.list_name)
                 return ()
             if upd_ts is not None and elem_ts != upd_ts:
-                _logger.debug(f"[LargeListReader:{self.list_name}] timestamp mismatch")
+                _logger.debug("[LargeListReader:%s] timestamp mismatch", self.list_name)
                 return ()
             if start_k is None:
-                _logger.debug(f"[LargeListReader:{self.list_name}] no start element")
+                _logger.debug("[LargeListReader:%s] no start element", self.list_name)
                 return ()
 
         ordered = self._ordered_chain(bucket, start_k)
         if size is not None and size > 0 and len(ordered) < size:
             _logger.debug(
-                f"[LargeListReader:{self.list_name}] ordered chain incomplete: have={len(ordered)}, need={size}"
+                "[LargeListReader:%s] ordered chain incomplete: have=%s, need=%s", self.list_name, len(ordered), size
             )
             return ()
 
@@ -478,7 +508,7 @@ class LargeListReader(ReaderDecorator):
 
         comb.collections[self.list_name] = views
         node._combined_by_key[parent_key] = comb
-        _logger.debug(f"[LargeListReader:{self.list_name}] complete with {len(views)} elements")
+        _logger.debug("[LargeListReader:%s] complete with %s elements", self.list_name, len(views))
         return (AssemblySignal(parent_key, complete=True),)
 
 
@@ -46,6 +46,7 @@ import rti.connextdds as dds
 from umaapy.util.umaa_utils import (
     guid_key,
     classify_obj_by_umaa,
+    classify_type_by_umaa,
     UMAAConcept,
     path_for_list_element,
     path_for_set_element,
@@ -388,7 +389,9 @@ class CombinedBuilder:
         """Get the specialization overlay at a given path, if any."""
         return self.overlays_by_path.get(tuple(path))
 
-    def spawn_child(self, base_obj: Any, path: Sequence[str] = ()) -> "CombinedBuilder":
+    def spawn_child(
+        self, base_obj: Any, path: Sequence[str] = (), into: Optional["CombinedBuilder"] = None
+    ) -> "CombinedBuilder":
         """
         Spawn a child builder scoped to `path`, rebasing nested overlays/collections.
 
@@ -401,6 +404,10 @@ class CombinedBuilder:
             Absolute node path for the child.
         base_obj : Any
             The child's base object.
+        into : CombinedBuilder, optional
+            Scratch builder to rebind and refill instead of allocating a new one.
+            Decorators publishing many elements pass the same scratch builder on
+            every iteration; it must not be retained past the child's publish.
 
         Returns
         -------
@@ -415,14 +422,22 @@ class CombinedBuilder:
         except Exception:
             pass
 
-        child_collections_by_path: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        if into is None:
+            child = CombinedBuilder(base=base_obj)
+        else:
+            child = into
+            child.base = base_obj
+            child.collections_by_path.clear()
+            child.overlays_by_path.clear()
+
+        child_collections_by_path = child.collections_by_path
         for k, v in self.collections_by_path.items():
             if len(k) >= len(p) and tuple(k[: len(p)]) == p:
                 rel = tuple(k[len(p) :])
                 # if rel:
                 child_collections_by_path[rel] = v
 
-        child_overlays: Dict[Tuple[Any, ...], Any] = {}
+        child_overlays = child.overlays_by_path
         for k, v in self.overlays_by_path.items():
             if len(k) >= len(p) and tuple(k[: len(p)]) == p:
                 rel = tuple(k[len(p) :])
@@ -433,11 +448,7 @@ class CombinedBuilder:
         except Exception:
             pass
 
-        return CombinedBuilder(
-            base=base_obj,
-            collections_by_path=child_collections_by_path,
-            overlays_by_path=child_overlays,
-        )
+        return child
 
     def __getattr__(self, name):
         if name == "collections":
@@ -1084,7 +1095,7 @@ class UmaaWriterAdapter:
             # If a specialization is requested, also initialize collections under it
             if spec_at is not None and spec_type is not None:
                 try:
-                    cmap_spec = classify_obj_by_umaa(spec_type())
+                    cmap_spec = classify_type_by_umaa(spec_type)
                 except Exception:
                     cmap_spec = {}
                 prefix = tuple(spec_at)
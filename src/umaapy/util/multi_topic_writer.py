@@ -28,7 +28,11 @@ class WriterDecorator:
     - leave the base in a ready-to-write state for the node.
     """
 
-    name: str = ""
+    __slots__ = ("name", "_children")
+
+    def __init__(self) -> None:
+        self.name: str = ""
+        self._children: Dict[str, WriterNode] = {}
 
     def attach_children(self, **children: "WriterNode") -> None:
         """Receive child mapping (topic or alias -> WriterNode)."""
@@ -15,6 +15,8 @@ from typing import Any, Dict, Optional, Sequence, Tuple, List
 
 from umaapy.util.multi_topic_support import (
     CombinedBuilder,
+    ListCollection,
+    SetCollection,
     get_at_path,
     path_for_set_element,
     path_for_list_element,
@@ -23,7 +25,7 @@ from umaapy.util.multi_topic_writer import WriterDecorator, WriterNode
 
 from umaapy.util.umaa_utils import topic_from_type
 
-from umaapy.util.uuid_factory import generate_guid, NIL_GUID
+from umaapy.util.uuid_factory import generate_guid, nil_guid, NIL_GUID
 
 
 class GenSpecWriter(WriterDecorator):
@@ -38,6 +40,8 @@ class GenSpecWriter(WriterDecorator):
         Optional mapping hook to resolve child names when specialization topics differ.
     """
 
+    __slots__ = ("attr_path",)
+
     def __init__(self, attr_path: Sequence[str] = ()):
         super().__init__()
         self.attr_path: Tuple[str, ...] = tuple(attr_path)
@@ -112,6 +116,8 @@ class GenSpecWriter(WriterDecorator):
 
 
 class LargeSetWriter(WriterDecorator):
+    __slots__ = ("set_name", "attr_path")
+
     def __init__(
         self,
         set_name: str,
@@ -141,14 +147,6 @@ class LargeSetWriter(WriterDecorator):
         if elem_ts is not None:
             setattr(meta, "updateElementTimestamp", elem_ts)
 
-    @staticmethod
-    def _elem_identity(elem: Any):
-        return getattr(elem, "elementID"), getattr(elem, "elementTimestamp", None)
-
-    @staticmethod
-    def _ensure_elem_set_id(elem: Any, set_id: Any) -> None:
-        setattr(elem, "setID", set_id)
-
     def publish(self, node: "WriterNode", builder: "CombinedBuilder") -> None:
         meta = self._meta_struct(builder.base)
 
@@ -171,7 +169,10 @@ class LargeSetWriter(WriterDecorator):
         if items is None:
             return
 
-        items = items.to_runtime()
+        # Snapshot runtime collections so mutation during child publishes can't disturb the loop;
+        # plain list/tuple inputs are iterated as given
+        if isinstance(items, (SetCollection, ListCollection)):
+            items = items.to_runtime()
         print(f"Large Set Publish Items: {items}")
         setattr(meta, "size", int(len(items)))
 
@@ -179,15 +180,18 @@ class LargeSetWriter(WriterDecorator):
             RuntimeError(f"LargeSetWriter Decorator only expects one child, but has {self._children.keys()}")
         child = next(iter(self._children.values()))
 
+        # If items were attached at the parent-of-metadata path, prefix element node paths with it
+        elem_prefix: Tuple[str, ...] = parent_path if used_parent_path else ()
+        set_name = self.set_name
+        # One scratch builder per publish call, rebound for each element
+        scratch = CombinedBuilder(base=None)
+
         last_id = last_ts = None
-        for idx, e in enumerate(items):
-            self._ensure_elem_set_id(e, set_id)
+        for e in items:
+            setattr(e, "setID", set_id)
             elem_id, elem_ts = getattr(e, "elementID"), getattr(e, "elementTimestamp", None)
-            # If items were attached at the parent-of-metadata path, prefix element node path with it
-            elem_prefix: Tuple[str, ...] = parent_path if used_parent_path else ()
-            elem_path = elem_prefix + path_for_set_element(self.set_name, elem_id)
-            child_b = builder.spawn_child(e, elem_path)
-            child.publish(child_b)
+            elem_path = elem_prefix + path_for_set_element(set_name, elem_id)
+            child.publish(builder.spawn_child(e, elem_path, into=scratch))
             last_id, last_ts = elem_id, elem_ts
 
         setattr(meta, "updateElementID", last_id)
@@ -196,6 +200,8 @@ class LargeSetWriter(WriterDecorator):
 
 
 class LargeListWriter(WriterDecorator):
+    __slots__ = ("list_name", "attr_path")
+
     def __init__(
         self,
         list_name: str,
@@ -219,32 +225,12 @@ class LargeListWriter(WriterDecorator):
     def _get_list_id(self, meta: Any) -> Any:
         return getattr(meta, "listID")
 
-    @staticmethod
-    def _set_starting(meta: Any, first_id: Any) -> None:
-        setattr(meta, "startingElementID", first_id)
-
     @staticmethod
     def _set_update_marker(meta: Any, last_id: Any, last_ts: Optional[Any]) -> None:
         setattr(meta, "updateElementID", last_id)
         if last_ts is not None:
             setattr(meta, "updateElementTimestamp", last_ts)
 
-    @staticmethod
-    def _elem_id(elem: Any) -> Any:
-        return getattr(elem, "elementID")
-
-    @staticmethod
-    def _elem_ts(elem: Any) -> Optional[Any]:
-        return getattr(elem, "elementTimestamp", None)
-
-    @staticmethod
-    def _set_next(elem: Any, next_id: Optional[Any]) -> None:
-        setattr(elem, "nextElementID", next_id)
-
-    @staticmethod
-    def _ensure_elem_list_id(elem: Any, list_id: Any) -> None:
-        setattr(elem, "listID", list_id)
-
     def publish(self, node: "WriterNode", builder: "CombinedBuilder") -> None:
         meta = self._meta_struct(builder.base)
 
@@ -267,19 +253,22 @@ class LargeListWriter(WriterDecorator):
             print("Large List Items is None")
             return
 
-        items = items.to_runtime()
+        # Snapshot runtime collections so mutation during child publishes can't disturb the loop;
+        # plain list/tuple inputs are iterated as given
+        if isinstance(items, (SetCollection, ListCollection)):
+            items = items.to_runtime()
         print(f"Large List Publish Items: {items}")
 
         # Handle empty list explicitly
         if not items:
             setattr(meta, "size", 0)
-            # Use NIL_GUID for required GUID fields; None for optional timestamp
+            # Use a nil GUID for required GUID fields; None for optional timestamp
             try:
-                setattr(meta, "startingElementID", NIL_GUID)
+                setattr(meta, "startingElementID", nil_guid())
             except Exception:
                 pass
             try:
-                setattr(meta, "updateElementID", NIL_GUID)
+                setattr(meta, "updateElementID", nil_guid())
                 setattr(meta, "updateElementTimestamp", None)
             except Exception:
                 pass
@@ -290,22 +279,33 @@ class LargeListWriter(WriterDecorator):
             RuntimeError(f"LargeListWriter Decorator only expects one child, but has {self._children.keys()}")
         child = next(iter(self._children.values()))
 
-        # link chain
-        for i, e in enumerate(items):
-            setattr(e, "listID", list_id)
-            nxt = getattr(items[i + 1], "elementID") if i + 1 < len(items) else None
-            setattr(e, "nextElementID", nxt)
+        # Element nodes live under the parent of the metadata field; prefix that path
+        parent_path = tuple(self.attr_path[:-1])
+
+        list_name = self.list_name
+        # One scratch builder per publish call, rebound for each element
+        scratch = CombinedBuilder(base=None)
+
+        def publish_element(e: Any) -> None:
+            elem_path = parent_path + path_for_list_element(list_name, getattr(e, "elementID"))
+            child.publish(builder.spawn_child(e, elem_path, into=scratch))
+
+        # Link the chain in a single pass: each element is published once its successor is known
+        first = prev = None
         for e in items:
-            elem_id = getattr(e, "elementID")
-            # Element nodes live under the parent of the metadata field; prefix that path
-            parent_path = tuple(self.attr_path[:-1])
-            elem_path = parent_path + path_for_list_element(self.list_name, elem_id)
-            child_b = builder.spawn_child(e, elem_path)
-            child.publish(child_b)
-
-        first_id = getattr(items[0], "elementID")
-        last_id = getattr(items[-1], "elementID")
-        last_ts = getattr(items[-1], "elementTimestamp", None)
+            setattr(e, "listID", list_id)
+            if prev is None:
+                first = e
+            else:
+                setattr(prev, "nextElementID", getattr(e, "elementID"))
+                publish_element(prev)
+            prev = e
+        setattr(prev, "nextElementID", None)
+        publish_element(prev)
+
+        first_id = getattr(first, "elementID")
+        last_id = getattr(prev, "elementID")
+        last_ts = getattr(prev, "elementTimestamp", None)
         setattr(meta, "startingElementID", first_id)
         setattr(meta, "updateElementID", last_id)
         if last_ts is not None:
@@ -74,26 +74,22 @@ class UmaaCommand(Command):
         self._logger: logging.Logger = logger.getChild(guid_pretty_print(command.sessionID))
 
         # Validate acknowledgement writer type
-        ack_type = ack_writer.topic.type()
+        ack_type = ack_writer.topic.type
         if not validate_umaa_obj(ack_type, UMAAConcept.ACKNOWLEDGEMENT):
-            raise RuntimeError(
-                f"'{ack_type.__class__.__name__.split('_')[-1]}' is not a valid UMAA command acknowledgement."
-            )
+            raise RuntimeError(f"'{ack_type.__name__.split('_')[-1]}' is not a valid UMAA command acknowledgement.")
         self._ack_writer: dds.DataWriter = ack_writer
 
         # Validate status writer type
-        status_type = status_writer.topic.type()
+        status_type = status_writer.topic.type
         if not validate_umaa_obj(status_type, UMAAConcept.STATUS):
-            raise RuntimeError(f"'{status_type.__class__.__name__.split('_')[-1]}' is not a valid UMAA status.")
+            raise RuntimeError(f"'{status_type.__name__.split('_')[-1]}' is not a valid UMAA status.")
         self._status_writer: dds.DataWriter = status_writer
 
         # Validate optional execution-status writer
         if execution_status_writer:
-            exec_type = execution_status_writer.topic.type()
+            exec_type = execution_status_writer.topic.type
             if not validate_umaa_obj(exec_type, UMAAConcept.EXECUTION_STATUS):
-                raise RuntimeError(
-                    f"'{exec_type.__class__.__name__.split('_')[-1]}' is not a valid UMAA execution status."
-                )
+                raise RuntimeError(f"'{exec_type.__name__.split('_')[-1]}' is not a valid UMAA execution status.")
         self._execution_status_writer: Optional[dds.DataWriter] = execution_status_writer
 
         # Internal synchronization and flags
@@ -101,6 +97,8 @@ class UmaaCommand(Command):
         self._updated: bool = False
         self._lock = threading.Lock()
         self._condition = threading.Condition(self._lock)
+        # Set whenever a cancel or update arrives so wait_for can block on the event directly
+        self._state_changed = threading.Event()
 
     def update(self, new_command: Any) -> None:
         """
@@ -112,6 +110,7 @@ class UmaaCommand(Command):
         with self._condition:
             self.command = new_command
             self._updated = True
+            self._state_changed.set()
             self._condition.notify_all()
 
     def cancel(self) -> None:
@@ -120,6 +119,7 @@ class UmaaCommand(Command):
         """
         with self._condition:
             self._cancelled = True
+            self._state_changed.set()
             self._condition.notify_all()
 
     def wait_for(
@@ -138,22 +138,21 @@ class UmaaCommand(Command):
         :rtype: Tuple[bool, bool]
         """
         end_time = time.monotonic() + timeout if timeout else None
-        with self._condition:
-            while True:
-                if self._cancelled:
+        while True:
+            if self._cancelled:
+                return False, False
+            if self._updated:
+                return False, True
+            if predicate():  # Desired condition reached
+                return True, False
+            # Compute remaining time
+            if end_time is not None:
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
                     return False, False
-                if self._updated:
-                    return False, True
-                if predicate():  # Desired condition reached
-                    return True, False
-                # Compute remaining time
-                if end_time is not None:
-                    remaining = end_time - time.monotonic()
-                    if remaining <= 0:
-                        return False, False
-                    self._condition.wait(remaining)
-                else:
-                    self._condition.wait()
+                self._state_changed.wait(remaining)
+            else:
+                self._state_changed.wait()
 
     @override
     def execute(self, *args: Any, **kwargs: Any) -> None:
@@ -168,40 +167,43 @@ class UmaaCommand(Command):
                 # Stage: Issued
                 with self._condition:
                     status_reason = CmdReason.UPDATED if self._updated else CmdReason.SUCCEEDED
-                    self._send_status(CmdStatus.ISSUED, status_reason, "Command issued.")
+                    self._emit_status(CmdStatus.ISSUED, status_reason, "Command issued.")
                     self._updated = False
+                    if not self._cancelled:
+                        self._state_changed.clear()
 
                 # Stage: Commanded
-                self._send_status(CmdStatus.COMMANDED, CmdReason.SUCCEEDED, "Command is being processed.")
+                self._emit_status(CmdStatus.COMMANDED, CmdReason.SUCCEEDED, "Command is being processed.")
+                self._flush()
                 self.on_commanded()
                 if self._cancelled:
-                    self._send_status(CmdStatus.CANCELED, CmdReason.CANCELED, "Command canceled.")
+                    self._emit_status(CmdStatus.CANCELED, CmdReason.CANCELED, "Command canceled.")
                     return
                 if self._updated:
                     continue
 
                 # Stage: Executing
-                self._send_status(CmdStatus.EXECUTING, CmdReason.SUCCEEDED, "Command execution started.")
+                self._emit_status(CmdStatus.EXECUTING, CmdReason.SUCCEEDED, "Command execution started.")
+                self._flush()
                 self.on_executing()
                 if self._cancelled:
-                    self._send_status(CmdStatus.CANCELED, CmdReason.CANCELED, "Command canceled.")
+                    self._emit_status(CmdStatus.CANCELED, CmdReason.CANCELED, "Command canceled.")
                     return
                 if self._updated:
                     continue
 
                 # Stage: Complete
                 self.on_complete()
-                self._send_status(CmdStatus.COMPLETED, CmdReason.SUCCEEDED, "Command completed.")
+                self._emit_status(CmdStatus.COMPLETED, CmdReason.SUCCEEDED, "Command completed.")
                 break
 
         except UmaaCommandException as uce:
             # UMAA-defined failure
-            self._send_status(CmdStatus.FAILED, uce.reason, uce.message)
+            self._emit_status_failed(uce.reason, uce.message)
             self.on_failed(uce)
         except Exception as e:
             # Unexpected exception
-            self._send_status(
-                CmdStatus.FAILED,
+            self._emit_status_failed(
                 CmdReason.SERVICE_FAILED,
                 f"{type(e).__name__} during execute: {e}",
             )
@@ -239,6 +241,8 @@ class UmaaCommand(Command):
                 except Exception as e:
                     pass
 
+            self._flush()
+
     def on_commanded(self) -> None:
         """
         Hook called after command is in COMMANDED state. Override in subclass.
@@ -283,6 +287,21 @@ class UmaaCommand(Command):
         """
         pass
 
+    def _flush(self) -> None:
+        """
+        Flush acknowledgement/status writes so they go out before a lifecycle hook runs (a no-op unless the
+        writers' QoS enables batching).
+
+        Flushing is best effort: a writer error is logged and never changes the command's outcome.
+        """
+        for writer in (self._ack_writer, self._status_writer, self._execution_status_writer):
+            if writer is None:
+                continue
+            try:
+                writer.flush()
+            except Exception as e:
+                self._logger.warning(f"Unable to flush {writer.topic.type.__name__} writer - {e}")
+
     def _send_ack(self) -> None:
         """
         Publish a command acknowledgement message with timestamp and session ID.
@@ -303,6 +322,9 @@ class UmaaCommand(Command):
         """
         Publish a status update message for the command lifecycle.
 
+        Dispatches to :meth:`_emit_status_failed` for FAILED and :meth:`_emit_status`
+        otherwise; :meth:`execute` calls the specialized variants directly.
+
         :param status: Current command status enum.
         :type status: CmdStatus
         :param reason: Reason enum for status transition.
@@ -310,12 +332,41 @@ class UmaaCommand(Command):
         :param message: Descriptive log message.
         :type message: str
         """
-        # Log at appropriate level
         if status == CmdStatus.FAILED:
-            self._logger.warning(message)
+            self._emit_status_failed(reason, message)
         else:
-            self._logger.debug(message)
+            self._emit_status(status, reason, message)
 
+    def _emit_status(self, status: CmdStatus, reason: CmdReason, message: str) -> None:
+        """
+        Log at debug level and publish a non-failure status update.
+
+        :param status: Current command status enum.
+        :type status: CmdStatus
+        :param reason: Reason enum for status transition.
+        :type reason: CmdReason
+        :param message: Descriptive log message.
+        :type message: str
+        """
+        self._logger.debug(message)
+        self._write_status(status, reason, message)
+
+    def _emit_status_failed(self, reason: CmdReason, message: str) -> None:
+        """
+        Log a warning and publish a FAILED status update.
+
+        :param reason: Reason enum for the failure.
+        :type reason: CmdReason
+        :param message: Descriptive log message.
+        :type message: str
+        """
+        self._logger.warning(message)
+        self._write_status(CmdStatus.FAILED, reason, message)
+
+    def _write_status(self, status: CmdStatus, reason: CmdReason, message: str) -> None:
+        """
+        Build and write a status sample for this command's session.
+        """
         status_sample = self._status_writer.topic.type()
         status_sample.timeStamp = Timestamp.now().to_umaa()
         status_sample.source = self._source_id
@@ -347,11 +398,11 @@ class UmaaCommandFactory:
         self.logger: Optional[logging.Logger] = None
 
         # Validate provided types
-        if not validate_umaa_obj(ack_type(), UMAAConcept.ACKNOWLEDGEMENT):
+        if not validate_umaa_obj(ack_type, UMAAConcept.ACKNOWLEDGEMENT):
             raise RuntimeError(f"'{ack_type.__name__.split('_')[-1]}' is not a valid UMAA acknowledgement.")
-        if not validate_umaa_obj(status_type(), UMAAConcept.STATUS):
+        if not validate_umaa_obj(status_type, UMAAConcept.STATUS):
             raise RuntimeError(f"'{status_type.__name__.split('_')[-1]}' is not a valid UMAA status.")
-        if execution_status_type and not validate_umaa_obj(execution_status_type(), UMAAConcept.EXECUTION_STATUS):
+        if execution_status_type and not validate_umaa_obj(execution_status_type, UMAAConcept.EXECUTION_STATUS):
             raise RuntimeError(f"'{execution_status_type.__name__.split('_')[-1]}' is not a valid UMAA exec status.")
 
         # Create DDS DataWriters for each sample type
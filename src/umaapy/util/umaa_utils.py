@@ -1,9 +1,12 @@
-from typing import Any, Type, Iterable, List, Set, Dict, Tuple, Optional
+from typing import Any, Callable, Type, Iterable, List, Mapping, Set, FrozenSet, Dict, Tuple, Optional
+import functools
 import logging
 import inspect
+import operator
 import importlib
 import inspect
 import re
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from collections import deque
@@ -15,18 +18,21 @@ from umaapy.umaa_types import (
     UMAA_Common_Measurement_NumericGUID as NumericGUID,
     UMAA_Common_IdentifierType as IdentifierType,
 )
+from umaapy.util.uuid_factory import guid_from_bytes
 
 
-class HashableNumericGUID(NumericGUID):
+class HashableNumericGUID:
     """
-    A hashable wrapper for NumericGUID that allows instances to be used
+    A hashable key for NumericGUID that allows GUIDs to be used
     in hashed collections (e.g. as dict keys or set members).
 
-    Inherits from NumericGUID and implements equality and hashing based
-    on the GUID's raw value.
+    Equality and hashing are based on the GUID's raw value, folded into a single
+    128-bit ``int`` at construction. This is a plain slotted object rather than a
+    NumericGUID subclass, so building a key never runs the generated IDL
+    constructor; :meth:`to_umaa` rebuilds a full NumericGUID when one is needed.
     """
 
-    __slots__ = ()
+    __slots__ = ("_key",)
 
     def __init__(self, base: NumericGUID):
         """
@@ -35,30 +41,51 @@ class HashableNumericGUID(NumericGUID):
         :param base: The NumericGUID instance to wrap.
         :type base: NumericGUID
         """
-        super().__init__(value=base.value)
+        self._key: int = int.from_bytes(bytes(base.value), "little")
+
+    @property
+    def value(self) -> bytes:
+        """
+        The GUID's 16 raw octets.
+
+        :return: GUID bytes, in the same order as ``NumericGUID.value``.
+        :rtype: bytes
+        """
+        return self._key.to_bytes(16, "little")
 
     def __eq__(self, other: Any) -> bool:
         """
-        Compare two GUIDs for equality based on their tuple value.
+        Compare two GUIDs for equality based on their 128-bit value.
 
         :param other: The object to compare against.
         :type other: Any
-        :return: True if other is a NumericGUID with the same value;
-                 NotImplemented if other isn't a NumericGUID.
+        :return: True if other is a (hashable) NumericGUID with the same value;
+                 NotImplemented otherwise.
         :rtype: bool
         """
+        if isinstance(other, HashableNumericGUID):
+            return self._key == other._key
         if not isinstance(other, NumericGUID):
             return NotImplemented
-        return tuple(self.value) == tuple(other.value)
+        return self._key == int.from_bytes(bytes(other.value), "little")
 
     def __hash__(self) -> int:
         """
-        Compute a hash from the GUID's tuple value.
+        Return the hash of the GUID's integer key.
 
-        :return: The hash of the underlying GUID tuple.
+        :return: The hash of the underlying GUID value.
         :rtype: int
         """
-        return hash(tuple(self.value))
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        """
+        Return a developer-friendly representation showing the GUID bytes.
+
+        :return: String of the form ``HashableNumericGUID(value=(...))``.
+        :rtype: str
+        """
+        return f"HashableNumericGUID(value={tuple(self.value)})"
 
     def to_umaa(self) -> NumericGUID:
         """
@@ -67,18 +94,19 @@ class HashableNumericGUID(NumericGUID):
         :return: A new NumericGUID instance with the same value.
         :rtype: NumericGUID
         """
-        return NumericGUID(value=self.value)
+        return guid_from_bytes(self.value)
 
 
-class HashableIdentifierType(IdentifierType):
+class HashableIdentifierType:
     """
-    A hashable wrapper for IdentifierType, making it usable in hashed
+    A hashable key for IdentifierType, making it usable in hashed
     collections by delegating to HashableNumericGUID for its IDs.
 
-    Inherits from IdentifierType and implements equality and hashing.
+    Like :class:`HashableNumericGUID` this is a plain slotted object; the hash is
+    combined from the two GUID keys once at construction.
     """
 
-    __slots__ = ()
+    __slots__ = ("id", "parentID", "_hash")
 
     def __init__(self, base: IdentifierType):
         """
@@ -87,10 +115,9 @@ class HashableIdentifierType(IdentifierType):
         :param base: The IdentifierType instance to wrap.
         :type base: IdentifierType
         """
-        super().__init__(
-            id=HashableNumericGUID(base.id),
-            parentID=HashableNumericGUID(base.parentID),
-        )
+        self.id: HashableNumericGUID = HashableNumericGUID(base.id)
+        self.parentID: HashableNumericGUID = HashableNumericGUID(base.parentID)
+        self._hash: int = hash((self.id, self.parentID))
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -98,22 +125,31 @@ class HashableIdentifierType(IdentifierType):
 
         :param other: The object to compare against.
         :type other: Any
-        :return: True if other is an IdentifierType with the same id
-                 and parentID; NotImplemented if other isn't IdentifierType.
+        :return: True if other is a (hashable) IdentifierType with the same id
+                 and parentID; NotImplemented otherwise.
         :rtype: bool
         """
-        if not isinstance(other, IdentifierType):
+        if not isinstance(other, (HashableIdentifierType, IdentifierType)):
             return NotImplemented
         return self.id == other.id and self.parentID == other.parentID
 
     def __hash__(self) -> int:
         """
-        Compute a hash from the tuple of this IdentifierType's id and parentID.
+        Return the hash of (id, parentID), cached at construction.
 
         :return: The hash of (id, parentID).
         :rtype: int
         """
-        return hash((self.id, self.parentID))
+        return self._hash
+
+    def __repr__(self) -> str:
+        """
+        Return a developer-friendly representation showing both GUID keys.
+
+        :return: String of the form ``HashableIdentifierType(id=..., parentID=...)``.
+        :rtype: str
+        """
+        return f"HashableIdentifierType(id={self.id!r}, parentID={self.parentID!r})"
 
     def to_umaa(self) -> IdentifierType:
         """
@@ -157,6 +193,9 @@ def guid_key(value: Any) -> Any:
     return value
 
 
+_GUID_TYPES = (NumericGUID, HashableNumericGUID)
+
+
 def guid_equal(a: Any, b: Any) -> bool:
     """
     Robust equality across (NumericGUID|HashableNumericGUID|other) values.
@@ -171,6 +210,9 @@ def guid_equal(a: Any, b: Any) -> bool:
     bool
         True when the underlying GUID values (or raw values) match.
     """
+    # Common case on the reader path: two GUIDs, compared on raw bytes without building keys
+    if isinstance(a, _GUID_TYPES) and isinstance(b, _GUID_TYPES):
+        return bytes(a.value) == bytes(b.value)
     ak = guid_key(a)
     bk = guid_key(b)
     try:
@@ -183,16 +225,41 @@ def make_instance_key_fn(key_fields: Iterable[str]):
     """
     Build a reader key function that returns a tuple of UMAA-aware key fields.
 
-    - Accepts *dotted* attribute names (e.g., "header.sessionID").
+    - Accepts *dotted* attribute names (e.g., "header.sessionID"), resolved as nested attribute
+      paths like :func:`operator.attrgetter`, not as literal attribute names containing a dot.
+      A field whose path is missing or ends in None is left out of the key.
     - GUID fields are normalized via guid_key() for stable hashing/equality.
 
     Example:
         key_fn = make_instance_key_fn(("sessionID", "destination", "source"))
     """
     fields = tuple(key_fields)
-
-    def _fn(sample):
-        return tuple([guid_key(getattr(sample, field)) for field in fields if getattr(sample, field, None) is not None])
+    if not fields:
+
+        def _fn(sample):
+            return ()
+
+    else:
+        # One C-level call fetches every key field; per-field getters are only the fallback
+        # for samples missing one of them
+        get_all = operator.attrgetter(*fields)
+        single = len(fields) == 1
+        field_getters = tuple(operator.attrgetter(field) for field in fields)
+
+        def _fn(sample):
+            try:
+                values = get_all(sample)
+            except AttributeError:
+                values = []
+                for getter in field_getters:
+                    try:
+                        values.append(getter(sample))
+                    except AttributeError:
+                        pass
+            else:
+                if single:
+                    values = (values,)
+            return tuple([guid_key(value) for value in values if value is not None])
 
     _fn.__signature__ = inspect.Signature(parameters=[inspect.Parameter("sample", inspect.Parameter.POSITIONAL_ONLY)])
     return _fn
@@ -203,7 +270,7 @@ def infer_umaa_key_fields(dtype: type) -> tuple[str, ...]:
     Try to infer stable UMAA key fields for a type using classify_obj_by_umaa.
     Falls back to common UMAA naming patterns.
     """
-    f_info: Optional[UMAAFieldInfo] = classify_obj_by_umaa(dtype()).get((), None)
+    f_info: Optional[UMAAFieldInfo] = classify_type_by_umaa(dtype).get((), None)
     out = set()
     if f_info is not None:
         for classification in f_info.classifications:
@@ -251,17 +318,40 @@ def path_for_list_element(list_name: str, element_id: Any) -> Tuple[str, str, An
     return ("#list", list_name, guid_key(element_id))
 
 
+# Topic names per UMAA type class; generated types live for the whole process
+_TOPIC_NAMES: Dict[Type, str] = {}
+
+
 def topic_from_type(umaa_type: Type) -> str:
     """
     Derive a DDS topic name from a UMAA type class by replacing underscores with '::'.
 
+    The result is memoized per class, since it is looked up on every specialization publish.
+
     :param umaa_type: The UMAA DDS type class.
     :type umaa_type: Type
     :return: Topic name string used in DDS filters.
     :rtype: str
     """
-    # Convert C++-style nested names to :: separators
-    return umaa_type.__name__.replace("_", "::")
+    try:
+        return _TOPIC_NAMES[umaa_type]
+    except KeyError:
+        # Convert C++-style nested names to :: separators; interned so the topic keys held
+        # by writer/reader nodes compare by identity
+        return _TOPIC_NAMES.setdefault(umaa_type, sys.intern(umaa_type.__name__.replace("_", "::")))
+
+
+def _compile_field_check(attrs: FrozenSet[str]) -> Callable[[Mapping[str, Any]], bool]:
+    """
+    Generate ``check(fields) -> bool`` testing that every name in `attrs` is a key of `fields`.
+
+    The body is unrolled into ``'a' in fields and 'b' in fields ...`` so each probe is a
+    single dict lookup, with no loop, set iteration or temporary objects.
+    """
+    body = " and ".join(f"{name!r} in fields" for name in sorted(attrs)) or "True"
+    namespace: Dict[str, Any] = {}
+    exec(f"def check(fields):\n    return {body}\n", namespace)
+    return namespace["check"]
 
 
 class UMAAConcept(Enum):
@@ -303,8 +393,21 @@ class UMAAConcept(Enum):
     )
 
     def __init__(self, _, attrs: Set[str], keys: Set[str]) -> None:
-        self.attrs: Set[str] = attrs
-        self.keys: Set[str] = keys
+        self.attrs: FrozenSet[str] = frozenset(attrs)
+        self.keys: FrozenSet[str] = frozenset(keys)
+        self.has_fields: Callable[[Mapping[str, Any]], bool] = _compile_field_check(self.attrs)
+        # Filled in below once every member exists
+        self.supersets: Tuple["UMAAConcept", ...] = ()
+
+
+# Iterating the Enum class goes through EnumType.__iter__; the traversal uses this tuple instead
+_CONCEPTS: Tuple[UMAAConcept, ...] = tuple(UMAAConcept)
+
+# Concepts whose attrs contain all of another's; a match is only kept when none of its
+# supersets matched at the same node (i.e. it is the most restrictive).
+for _concept in UMAAConcept:
+    _concept.supersets = tuple(o for o in UMAAConcept if o is not _concept and _concept.attrs <= o.attrs)
+del _concept
 
 
 @dataclass
@@ -313,18 +416,38 @@ class UMAAFieldInfo:
     python_type: Type[Any] = None
 
 
+def _field_names(obj: Any) -> Dict[str, Any]:
+    """
+    Return the field mapping declared by a UMAA type or carried by one of its instances.
+
+    Generated IDL types are dataclasses, so a class can be inspected through its
+    dataclass fields without constructing a sample. Anything else falls back to
+    the instance ``__dict__`` (constructing a default instance for classes).
+    """
+    if isinstance(obj, type):
+        fields = getattr(obj, "__dataclass_fields__", None)
+        return fields if fields is not None else vars(obj())
+    return vars(obj)
+
+
 def validate_umaa_obj(obj: Any, concept: UMAAConcept) -> bool:
     """
     Validate that the given object has the required fields for a UMAA special concept.
 
-    :param obj: An instance of a DDS UMAA data type.
+    :param obj: A DDS UMAA data type, or an instance of one.
     :type obj: Any
     :param concept: UMAA Concept to validate against
     :type concept: UMAAConcept
     :return: True if the object has all required fields, False otherwise.
     :rtype: bool
     """
-    return concept.attrs.issubset(set(vars(obj).keys()))
+    return concept.has_fields(_field_names(obj))
+
+
+# Leaf field types that never carry UMAA concepts (IntEnum members are ints too)
+_PRIMITIVES = (str, bytes, int, float, bool, type(None))
+# ...plus IDL sequences/arrays, which the traversal does not descend into
+_LEAF_TYPES = _PRIMITIVES + (list, tuple, bytearray)
 
 
 def classify_obj_by_umaa(obj: Any) -> Dict[Tuple[str, ...], UMAAFieldInfo]:
@@ -334,31 +457,77 @@ def classify_obj_by_umaa(obj: Any) -> Dict[Tuple[str, ...], UMAAFieldInfo]:
     a strict subset of any other matching concept’s attr_set.
     """
     cmap: Dict[Tuple[str, ...], UMAAFieldInfo] = {}
-    seen_ids = set()
-    queue = deque([((), obj)])
+    try:
+        root_fields = vars(obj)
+    except TypeError:
+        # Primitives and sequences carry no attributes to classify
+        return cmap
+
+    # The loop runs once per nested struct of every classified type; keep its lookups local
+    concepts = _CONCEPTS
+    leaf_types = _LEAF_TYPES
+    field_info = UMAAFieldInfo
+    _vars = vars
+    seen_ids = {id(obj)}
+    seen = seen_ids.add
+    queue = deque([((), obj, root_fields)])
+    push = queue.append
+    pop = queue.popleft
 
     while queue:
-        path, current = queue.popleft()
-        oid = id(current)
-        if oid in seen_ids:
-            continue
-        seen_ids.add(oid)
+        path, current, fields = pop()
 
-        if not hasattr(current, "__dict__"):
-            continue
-
-        matched = [c for c in UMAAConcept if c.attrs.issubset(set(vars(current).keys()))]
+        matched = [c for c in concepts if c.has_fields(fields)]
         if matched:
-            winners = {c for c in matched if not any(c.attrs.issubset(other.attrs) and c != other for other in matched)}
-            cmap[path] = UMAAFieldInfo(classifications=winners, python_type=type(current))
-
-        for name, val in vars(current).items():
-            if hasattr(val, "__dict__"):
-                queue.append((path + (name,), val))
+            winners = {c for c in matched if not any(other in matched for other in c.supersets)}
+            cmap[path] = field_info(classifications=winners, python_type=type(current))
+
+        for name, val in fields.items():
+            # Most IDL fields are scalars or sequences; skip them without paying for a failed vars()
+            if isinstance(val, leaf_types):
+                continue
+            oid = id(val)
+            if oid in seen_ids:
+                continue
+            try:
+                child_fields = _vars(val)
+            except TypeError:
+                continue
+            seen(oid)
+            push((path + (name,), val, child_fields))
 
     return cmap
 
 
+@functools.lru_cache(maxsize=None)
+def classify_type_by_umaa(umaa_type: Type) -> Dict[Tuple[str, ...], UMAAFieldInfo]:
+    """
+    Classify a default-constructed instance of `umaa_type`, cached per type.
+
+    The attribute shape of a generated UMAA type never changes, so the traversal
+    only needs to run once. The returned map is shared between callers and must
+    not be mutated.
+    """
+    return classify_obj_by_umaa(umaa_type())
+
+
+@functools.lru_cache(maxsize=None)
+def _module_classes(module_name: str) -> Tuple[Tuple[str, Type], ...]:
+    """Return ``(name, class)`` for every class defined in `module_name`, scanned once."""
+    mod = importlib.import_module(module_name)
+    # Plain __dict__ scan; inspect.getmembers would dir() and sort the whole module
+    return tuple(
+        (name, cls) for name, cls in vars(mod).items() if isinstance(cls, type) and cls.__module__ == module_name
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _specialization_regex(base: str) -> "re.Pattern[str]":
+    """Return the compiled name pattern for specializations of generalization `base`."""
+    return re.compile(rf"^UMAA_.+(?<!_){re.escape(base)}$")
+
+
+@functools.lru_cache(maxsize=None)
 def get_specializations_from_generalization(
     generalization: Type, module_name: str = "umaapy.umaa_types"
 ) -> Dict[str, Type]:
@@ -366,20 +535,21 @@ def get_specializations_from_generalization(
     Scans `module_name` for all classes matching *generalization's* base-type
     (using your regex), then returns a dict mapping the short name (after the
     last underscore) to the actual class object.
+
+    Results are cached per ``(generalization, module_name)``; the returned dict is
+    shared between callers and must not be mutated.
     """
-    if not validate_umaa_obj(generalization(), UMAAConcept.GENERALIZATION):
+    if not validate_umaa_obj(generalization, UMAAConcept.GENERALIZATION):
         raise RuntimeError(f"Invalid generalization type '{generalization.__name__}'")
 
-    mod = importlib.import_module(module_name)
-    base = generalization.__name__.split("_")[-1]
-    regex = re.compile(rf"^UMAA_.+(?<!_){re.escape(base)}$")
+    regex = _specialization_regex(generalization.__name__.split("_")[-1])
 
     out: Dict[str, Type] = {}
-    for name, cls in inspect.getmembers(mod, inspect.isclass):
-        if cls.__module__ != module_name or not regex.match(name):
+    for name, cls in _module_classes(module_name):
+        if not regex.match(name):
             continue
 
-        if not validate_umaa_obj(cls(), UMAAConcept.SPECIALIZATION):
+        if not validate_umaa_obj(cls, UMAAConcept.SPECIALIZATION):
             raise RuntimeError(f"Invalid specialization type '{cls.__name__}'")
 
         short = name.split("_")[-1]
@@ -7,6 +7,7 @@ This module provides:
 - Builders for UMAA identifier types.
 """
 
+import os
 import uuid
 from typing import List, Optional, Tuple
 from itertools import chain
@@ -15,21 +16,29 @@ import rti.connextdds as dds
 from umaapy.umaa_types import UMAA_Common_IdentifierType, UMAA_Common_Measurement_NumericGUID
 
 
-# Global constant for a nil (all zeros) GUID in UMAA NumericGUID format
-NIL_GUID: UMAA_Common_Measurement_NumericGUID = UMAA_Common_Measurement_NumericGUID(dds.Uint8Seq([0] * 16))
+_NIL_BYTES = bytes(16)
+
+# Global constant for a nil (all zeros) GUID in UMAA NumericGUID format. Use it for
+# comparisons only; assign nil_guid() into samples so they never alias this object.
+NIL_GUID: UMAA_Common_Measurement_NumericGUID = UMAA_Common_Measurement_NumericGUID(dds.Uint8Seq(_NIL_BYTES))
+
+# Bound once for generate_guid(), which runs for every new command, ack and session
+_urandom = os.urandom
+_Uint8Seq = dds.Uint8Seq
+_NumericGUID = UMAA_Common_Measurement_NumericGUID
 
 
 def guid_to_hex(guid: UMAA_Common_Measurement_NumericGUID) -> str:
     """
-    Convert a UMAA NumericGUID to a lowercase hex string without separators.
+    Convert a UMAA NumericGUID to a lowercase hex string, one space between bytes.
 
     :param guid: UMAA NumericGUID instance containing 16 bytes.
     :type guid: UMAA_Common_Measurement_NumericGUID
-    :return: Hexadecimal representation (e.g., 'aabbcc...').
+    :return: Hexadecimal representation (e.g., 'aa bb cc ...').
     :rtype: str
     """
-    # Join each byte formatted as two-digit hex
-    return " ".join(f"{b:02x}" for b in guid.value)
+    # bytes.hex() formats every octet in one C call
+    return bytes(guid.value).hex(" ")
 
 
 def guid_pretty_print(guid: UMAA_Common_Measurement_NumericGUID) -> str:
@@ -68,6 +77,16 @@ def make_filter_for_guid(*names: str) -> str:
     return " AND ".join(clauses)
 
 
+def nil_guid() -> UMAA_Common_Measurement_NumericGUID:
+    """
+    Return a new all-zero UMAA NumericGUID, safe to store in (and mutate on) a sample.
+
+    :return: A fresh nil NumericGUID equal to NIL_GUID.
+    :rtype: UMAA_Common_Measurement_NumericGUID
+    """
+    return _NumericGUID(_Uint8Seq(_NIL_BYTES))
+
+
 def generate_guid() -> UMAA_Common_Measurement_NumericGUID:
     """
     Generate a new random UUID4 and wrap it in a UMAA NumericGUID.
@@ -75,8 +94,11 @@ def generate_guid() -> UMAA_Common_Measurement_NumericGUID:
     :return: A UMAA NumericGUID representing a new UUID4.
     :rtype: UMAA_Common_Measurement_NumericGUID
     """
-    # Generate Python UUID4, take raw bytes, and construct DDS sequence
-    return UMAA_Common_Measurement_NumericGUID(dds.Uint8Seq(uuid.uuid4().bytes))
+    # Same layout as uuid.uuid4().bytes, without building a uuid.UUID object
+    raw = bytearray(_urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return _NumericGUID(_Uint8Seq(raw))
 
 
 def guid_from_string(guid_str: str) -> UMAA_Common_Measurement_NumericGUID:
@@ -97,6 +119,18 @@ def guid_from_uuid(py_uuid: uuid.UUID) -> UMAA_Common_Measurement_NumericGUID:
     return UMAA_Common_Measurement_NumericGUID(dds.Uint8Seq(py_uuid.bytes))
 
 
+def guid_from_bytes(raw: bytes) -> UMAA_Common_Measurement_NumericGUID:
+    """
+    Wrap 16 raw octets in a UMAA NumericGUID.
+
+    :param raw: GUID bytes.
+    :type raw: bytes
+    :return: A UMAA NumericGUID holding `raw`.
+    :rtype: UMAA_Common_Measurement_NumericGUID
+    """
+    return _NumericGUID(_Uint8Seq(raw))
+
+
 def build_identifier_type(source_id: str, parent_id: str) -> UMAA_Common_IdentifierType:
     """
     Construct a UMAA_Common_IdentifierType given string GUIDs for source and parent.
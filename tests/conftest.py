@@ -2,7 +2,9 @@ import os
 import sys
 import types
 import pathlib
-import dataclasses
+import functools
+import importlib.abc
+import importlib.util
 import pytest
 
 os.environ.setdefault("UMAAPY_AUTO_INIT", "0")
@@ -11,6 +13,7 @@ REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
 LOCAL_PACKAGE_ROOT = REPO_ROOT / "src" / "umaapy"
 
 
+@functools.lru_cache(maxsize=1)
 def _license_present() -> bool:
     """Detect whether an RTI license file is available.
 
@@ -30,100 +33,159 @@ def _license_present() -> bool:
 
 LICENSE_OK = _license_present()
 
+# Vendor-only test modules (module-level integration_vendor mark). Without a license they are
+# not collected at all, so their rti/umaapy.core imports never run.
+if not LICENSE_OK:
+    collect_ignore_glob = [
+        "core/test_*.py",
+        "integration/test_*.py",
+        "util/test_dds_configurator.py",
+        "util/test_multi_topic_reader*.py",
+        "util/test_multi_topic_writer*.py",
+    ]
+
 
 def _connext_importable() -> bool:
-    try:
-        import rti.connextdds  # noqa: F401
+    """Detect whether rti.connextdds is installed, without loading the extension.
 
-        return True
-    except Exception:
+    Set UMAAPY_SKIP_RTI_PROBE=1 to skip the probe and always use the stubs.
+    """
+    if os.environ.get("UMAAPY_SKIP_RTI_PROBE"):
+        return False
+    try:
+        return importlib.util.find_spec("rti.connextdds") is not None
+    except (ImportError, ValueError):
         return False
 
 
 CONNEXT_AVAILABLE = _connext_importable()
 
 
-def _install_stub_modules() -> None:
-    """Provide minimal RTI stubs so non-vendor tests can import the package."""
-    if all(name in sys.modules for name in ("rti.connextdds", "rti.idl", "rti.rpc")):
-        return
+class _DDSStub:
+    # Stubs carry no state, so every derived value is the one shared instance below
+    __slots__ = ()
 
-    try:
-        import rti as rti_pkg  # type: ignore[import-not-found]
-    except Exception:
-        rti_pkg = types.ModuleType("rti")
-        sys.modules["rti"] = rti_pkg
+    ALL = 0
+    NONE = 0
+    ANY = 0
 
-    class _DDSStub:
-        ALL = 0
-        NONE = 0
-        ANY = 0
+    def __init__(self, *args, **kwargs):
+        pass
 
-        def __init__(self, *args, **kwargs):
-            pass
+    def __call__(self, *args, **kwargs):
+        return _DDS_STUB_SINGLETON
 
-        def __call__(self, *args, **kwargs):
-            return _DDSStub()
+    def __iter__(self):
+        return iter(())
 
-        def __iter__(self):
-            return iter(())
+    def __getattr__(self, name):
+        return _DDS_STUB_SINGLETON
 
-        def __getattr__(self, name):
-            return _DDSStub()
+    @classmethod
+    def find(cls, *args, **kwargs):
+        return None
 
-        @classmethod
-        def find(cls, *args, **kwargs):
-            return None
+    def read(self, *args, **kwargs):
+        return []
 
-        def read(self, *args, **kwargs):
-            return []
+    def take(self, *args, **kwargs):
+        return []
 
-        def take(self, *args, **kwargs):
-            return []
+    def set_listener(self, *args, **kwargs):
+        return None
 
-        def set_listener(self, *args, **kwargs):
-            return None
 
-    class _QosProvider(_DDSStub):
-        def participant_qos_from_profile(self, *args, **kwargs):
-            return _DDSStub()
-
-        def datawriter_qos_from_profile(self, *args, **kwargs):
-            return _DDSStub()
-
-        def datareader_qos_from_profile(self, *args, **kwargs):
-            return _DDSStub()
-
-    connextdds_mod = types.ModuleType("rti.connextdds")
-    connextdds_mod.DataReader = _DDSStub
-    connextdds_mod.DataWriter = _DDSStub
-    connextdds_mod.DataReaderListener = _DDSStub
-    connextdds_mod.DataWriterListener = _DDSStub
-    connextdds_mod.NoOpDataReaderListener = _DDSStub
-    connextdds_mod.NoOpDataWriterListener = _DDSStub
-    connextdds_mod.QosProvider = _QosProvider
-    connextdds_mod.DomainParticipant = _DDSStub
-    connextdds_mod.Publisher = _DDSStub
-    connextdds_mod.Subscriber = _DDSStub
-    connextdds_mod.Topic = _DDSStub
-    connextdds_mod.ContentFilteredTopic = _DDSStub
-    connextdds_mod.Filter = _DDSStub
-    connextdds_mod.DataWriterQos = _DDSStub
-    connextdds_mod.DataReaderQos = _DDSStub
-    connextdds_mod.InstanceHandle = _DDSStub
-    connextdds_mod.StatusMask = _DDSStub
-    connextdds_mod.InstanceState = _DDSStub
-    connextdds_mod.Uint8Seq = lambda values=(): list(values)
-    connextdds_mod.__getattr__ = lambda _name: _DDSStub
-
-    class _ModuleNamespace:
-        def __init__(self, name: str):
-            self.__name__ = name
-
-        def __repr__(self):
-            return f"<RTIStubModule {self.__name__}>"
-
-    idl_mod = types.ModuleType("rti.idl")
+_DDS_STUB_SINGLETON = _DDSStub()
+
+
+class _QosProvider(_DDSStub):
+    __slots__ = ()
+
+    def participant_qos_from_profile(self, *args, **kwargs):
+        return _DDS_STUB_SINGLETON
+
+    def datawriter_qos_from_profile(self, *args, **kwargs):
+        return _DDS_STUB_SINGLETON
+
+    def datareader_qos_from_profile(self, *args, **kwargs):
+        return _DDS_STUB_SINGLETON
+
+
+class _ModuleNamespace:
+    def __init__(self, name: str):
+        self.__name__ = name
+
+    def __repr__(self):
+        return f"<RTIStubModule {self.__name__}>"
+
+
+# rti.connextdds names that need something other than the generic _DDSStub
+_CONNEXTDDS_SPECIAL = {
+    "QosProvider": _QosProvider,
+    "Uint8Seq": lambda values=(): list(values),
+}
+
+
+def _connextdds_getattr(name: str):
+    """PEP 562 module __getattr__: every rti.connextdds name resolves on first access."""
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return _CONNEXTDDS_SPECIAL.get(name, _DDSStub)
+
+
+def _populate_connextdds(connextdds_mod: types.ModuleType) -> None:
+    connextdds_mod.__getattr__ = _connextdds_getattr
+
+
+def _fast_idl_struct(cls):
+    """Cheap stand-in for dataclasses.dataclass on stubbed IDL types.
+
+    Keeps the declared defaults (including default_factory), positional/keyword
+    construction and field-wise equality, without generating code per class.
+    """
+    import dataclasses
+    import inspect
+
+    spec = []
+    # get_annotations also covers lazily evaluated annotations (PEP 649), absent from __dict__
+    for name in inspect.get_annotations(cls):
+        value = cls.__dict__.get(name)
+        factory = None
+        if isinstance(value, dataclasses.Field):
+            if value.default_factory is not dataclasses.MISSING:
+                factory = value.default_factory
+            value = None if value.default is dataclasses.MISSING else value.default
+            setattr(cls, name, value)
+        spec.append((name, value, factory))
+    names = tuple(name for name, _, _ in spec)
+
+    def __init__(self, *args, **kwargs):
+        values = self.__dict__
+        for name, value, factory in spec:
+            values[name] = value if factory is None else factory()
+        if args:
+            values.update(zip(names, args))
+        if kwargs:
+            values.update(kwargs)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def __repr__(self):
+        return f"{cls.__qualname__}({', '.join(f'{n}={getattr(self, n)!r}' for n in names)})"
+
+    cls.__init__ = __init__
+    cls.__eq__ = __eq__
+    cls.__repr__ = __repr__
+    cls.__hash__ = None
+    return cls
+
+
+def _populate_idl(idl_mod: types.ModuleType) -> None:
+    import dataclasses
+
     _idl_modules: dict[str, _ModuleNamespace] = {}
 
     def _idl_get_module(name: str):
@@ -133,11 +195,11 @@ def _install_stub_modules() -> None:
             _idl_modules[name] = module
         return module
 
-    def _idl_dataclass_decorator(*args, **kwargs):
-        def decorator(cls):
-            return dataclasses.dataclass(cls)
+    # Set UMAAPY_FAST_IDL_STUBS=0 to decorate stubbed IDL types with real dataclasses
+    make_type = _fast_idl_struct if os.environ.get("UMAAPY_FAST_IDL_STUBS", "1") == "1" else dataclasses.dataclass
 
-        return decorator
+    def _idl_dataclass_decorator(*args, **kwargs):
+        return make_type
 
     idl_mod.get_module = _idl_get_module
     idl_mod.alias = _idl_dataclass_decorator
@@ -148,9 +210,13 @@ def _install_stub_modules() -> None:
 
     def _idl_array_factory(typ, dims=None):
         if dims is None:
-            return lambda: []
+            return list
         length = int(dims[0]) if isinstance(dims, (list, tuple)) else int(dims)
-        return lambda: [typ() if callable(typ) else 0 for _ in range(length)]
+        # Immutable element defaults can be repeated; anything else needs one instance per slot
+        if typ in (int, float, bool, str) or not callable(typ):
+            filler = [typ() if callable(typ) else 0]
+            return lambda: filler * length
+        return lambda: [typ() for _ in range(length)]
 
     idl_mod.array_factory = _idl_array_factory
     idl_mod.bound = lambda *args, **kwargs: ("bound", args, kwargs)
@@ -163,21 +229,52 @@ def _install_stub_modules() -> None:
     idl_mod.int32 = int
     idl_mod.char = str
 
-    rpc_mod = types.ModuleType("rti.rpc")
 
-    rti_pkg.connextdds = connextdds_mod
-    rti_pkg.idl = idl_mod
-    rti_pkg.rpc = rpc_mod
+class _RTIStubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Serve minimal RTI stub modules so non-vendor tests can import the package.
+
+    Nothing is built up front: each stub module is created and populated only when
+    something first imports it.
+    """
+
+    _POPULATORS = {
+        "rti": None,
+        "rti.connextdds": _populate_connextdds,
+        "rti.idl": _populate_idl,
+        "rti.rpc": None,
+    }
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in self._POPULATORS:
+            return None
+        return importlib.util.spec_from_loader(fullname, self, is_package=fullname == "rti")
+
+    def create_module(self, spec):
+        return None  # default module creation
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        populate = self._POPULATORS[module.__name__]
+        if populate is not None:
+            populate(module)
 
-    sys.modules["rti.connextdds"] = connextdds_mod
-    sys.modules["rti.idl"] = idl_mod
-    sys.modules["rti.rpc"] = rpc_mod
+
+def _install_stub_modules() -> None:
+    """Register the RTI stub finder ahead of the regular import machinery."""
+    if all(name in sys.modules for name in ("rti.connextdds", "rti.idl", "rti.rpc")):
+        return
+    if not any(isinstance(finder, _RTIStubFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _RTIStubFinder())
 
 
 if not CONNEXT_AVAILABLE:
     _install_stub_modules()
 
 
+@functools.cache
+def _local_package_root() -> str:
+    return os.path.realpath(LOCAL_PACKAGE_ROOT)
+
+
 def _local_import_hygiene_error() -> str | None:
     try:
         import umaapy  # noqa: F401
@@ -187,10 +284,14 @@ def _local_import_hygiene_error() -> str | None:
             "Install the workspace package in editable mode with: pip install -e .[tests]"
         )
 
-    import_path = pathlib.Path(umaapy.__file__).resolve()
+    import_path = os.path.realpath(umaapy.__file__)
+    local_root = _local_package_root()
     try:
-        import_path.relative_to(LOCAL_PACKAGE_ROOT)
+        in_local_tree = os.path.commonpath([import_path, local_root]) == local_root
     except ValueError:
+        # Different drives (e.g. site-packages elsewhere on Windows): certainly not this tree
+        in_local_tree = False
+    if not in_local_tree:
         return (
             f"import umaapy resolved to '{import_path}', not this workspace source tree '{LOCAL_PACKAGE_ROOT}'. "
             "Reinstall with: pip install -e .[tests]"
@@ -199,14 +300,38 @@ def _local_import_hygiene_error() -> str | None:
 
 
 def pytest_sessionstart(session: pytest.Session) -> None:
+    # Set UMAAPY_SKIP_HYGIENE_CHECK=1 to skip verifying that umaapy imports from this tree
+    if os.environ.get("UMAAPY_SKIP_HYGIENE_CHECK"):
+        return
     error = _local_import_hygiene_error()
     if error:
         raise pytest.UsageError(error)
 
 
+@pytest.fixture
+def wait_for_status():
+    """Return a helper that blocks until a DDS entity raises a status in ``mask``.
+
+    The helper raises ``rti.connextdds.TimeoutError`` if ``timeout`` seconds pass first.
+    """
+    import rti.connextdds as dds
+
+    def wait(entity, mask, timeout: float = 2.0) -> None:
+        condition = dds.StatusCondition(entity)
+        condition.enabled_statuses = mask
+        waitset = dds.WaitSet()
+        waitset += condition
+        waitset.wait(dds.Duration.from_seconds(timeout))
+
+    return wait
+
+
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    # Without a license the vendor tests cannot run at all, so drop them rather than reporting skips
     if not LICENSE_OK:
-        skip = pytest.mark.skip(reason="RTI Connext DDS license missing/expired; integration_vendor tests skipped.")
+        kept, removed = [], []
         for item in items:
-            if item.get_closest_marker("integration_vendor"):
-                item.add_marker(skip)
+            (removed if item.get_closest_marker("integration_vendor") else kept).append(item)
+        if removed:
+            items[:] = kept
+            config.hook.pytest_deselected(items=removed)
@@ -5,7 +5,7 @@ from time import sleep
 import logging
 from threading import Condition
 
-import rti.connextdds as dds
+dds = pytest.importorskip("rti.connextdds", reason="RTI Connext DDS not available")
 
 from umaapy.core.command_consumer import CommandConsumer
 from umaapy.core.command_provider import CommandProvider
@@ -1,13 +1,13 @@
 import pytest
-from typing import override
-from time import sleep
+from typing import List, override
 import logging
-import rti.connextdds as dds
+from threading import Condition
+
+dds = pytest.importorskip("rti.connextdds", reason="RTI Connext DDS not available")
 
 from umaapy import get_configurator, get_event_processor, reset_dds_participant
 from umaapy.util.dds_configurator import UmaaQosProfileCategory
 from umaapy.core.command_provider import CommandProvider
-from umaapy.util.uuid_factory import *
 
 from umaapy.examples.global_vector_control import GlobalVectorControlCommandFactory, _global_vector_control_source_id
 
@@ -28,16 +28,39 @@ class TestStatusListener(dds.DataReaderListener):
     def __init__(self):
         super().__init__()
         self.sample_list: List[str] = []
+        self._received = Condition()
 
     @override
     def on_data_available(self, reader: dds.DataReader):
-        for sample in reader.take_data():
-            self.sample_list.append(sample.commandStatus)
+        with self._received:
+            for sample in reader.take_data():
+                self.sample_list.append(sample.commandStatus)
+            self._received.notify_all()
+
+    def wait_for_samples(self, count: int, timeout: float = 2.0) -> bool:
+        """Block until at least ``count`` statuses have arrived or ``timeout`` seconds pass."""
+        with self._received:
+            return self._received.wait_for(lambda: len(self.sample_list) >= count, timeout)
 
 
-def test_49_umaa_command_flow():
+@pytest.fixture
+def global_vector_provider():
+    """GlobalVectorControl provider on a fresh participant; rebuilt per test because each test resets DDS."""
+    reset_dds_participant()
+    provider = CommandProvider(
+        _global_vector_control_source_id,
+        GlobalVectorControlCommandFactory(
+            UMAA_MO_GlobalVectorControl_GlobalVectorCommandAckReportType,
+            UMAA_MO_GlobalVectorControl_GlobalVectorCommandStatusType,
+            UMAA_MO_GlobalVectorControl_GlobalVectorExecutionStatusReportType,
+        ),
+        UMAA_MO_GlobalVectorControl_GlobalVectorCommandType,
+    )
+    yield provider
     reset_dds_participant()
 
+
+def test_49_umaa_command_flow(global_vector_provider, wait_for_status):
     test_status_flow = [
         CmdStatus.ISSUED,
         CmdStatus.COMMANDED,
@@ -49,22 +72,6 @@ def test_49_umaa_command_flow():
     ]
     status_listener = TestStatusListener()
 
-    GlobalVectorControlCommandFactory(
-        UMAA_MO_GlobalVectorControl_GlobalVectorCommandAckReportType,
-        UMAA_MO_GlobalVectorControl_GlobalVectorCommandStatusType,
-        UMAA_MO_GlobalVectorControl_GlobalVectorExecutionStatusReportType,
-    )
-
-    global_vector_control_service_provider = CommandProvider(
-        _global_vector_control_source_id,
-        GlobalVectorControlCommandFactory(
-            UMAA_MO_GlobalVectorControl_GlobalVectorCommandAckReportType,
-            UMAA_MO_GlobalVectorControl_GlobalVectorCommandStatusType,
-            UMAA_MO_GlobalVectorControl_GlobalVectorExecutionStatusReportType,
-        ),
-        UMAA_MO_GlobalVectorControl_GlobalVectorCommandType,
-    )
-
     test_cmd_writer = get_configurator().get_writer(
         UMAA_MO_GlobalVectorControl_GlobalVectorCommandType,
         profile_category=UmaaQosProfileCategory.COMMAND,
@@ -84,43 +91,28 @@ def test_49_umaa_command_flow():
 
     gv_cmd = UMAA_MO_GlobalVectorControl_GlobalVectorCommandType()
     gv_cmd.destination = _global_vector_control_source_id
-    sleep(2.0)
+    wait_for_status(test_cmd_writer, dds.StatusMask.PUBLICATION_MATCHED)
+    wait_for_status(test_ack_reader, dds.StatusMask.SUBSCRIPTION_MATCHED)
+    wait_for_status(test_status_reader, dds.StatusMask.SUBSCRIPTION_MATCHED)
 
     test_cmd_writer.write(gv_cmd)
-    sleep(0.5)
+    assert status_listener.wait_for_samples(3)
     test_cmd_writer.write(gv_cmd)
-    sleep(0.5)
+    assert status_listener.wait_for_samples(6)
     ih = test_cmd_writer.lookup_instance(gv_cmd)
     test_cmd_writer.dispose_instance(ih)
-    sleep(0.5)
+    assert status_listener.wait_for_samples(len(test_status_flow))
 
     assert len(test_ack_reader.read_data()) > 0
 
+    assert len(status_listener.sample_list) == len(test_status_flow)
     for status, test_status in zip(status_listener.sample_list, test_status_flow):
         assert status == test_status
 
 
-def test_50_destination_content_filter():
-    reset_dds_participant()
-    sleep(1)
+def test_50_destination_content_filter(global_vector_provider, wait_for_status):
     status_listener = TestStatusListener()
 
-    GlobalVectorControlCommandFactory(
-        UMAA_MO_GlobalVectorControl_GlobalVectorCommandAckReportType,
-        UMAA_MO_GlobalVectorControl_GlobalVectorCommandStatusType,
-        UMAA_MO_GlobalVectorControl_GlobalVectorExecutionStatusReportType,
-    )
-
-    global_vector_control_service_provider = CommandProvider(
-        _global_vector_control_source_id,
-        GlobalVectorControlCommandFactory(
-            UMAA_MO_GlobalVectorControl_GlobalVectorCommandAckReportType,
-            UMAA_MO_GlobalVectorControl_GlobalVectorCommandStatusType,
-            UMAA_MO_GlobalVectorControl_GlobalVectorExecutionStatusReportType,
-        ),
-        UMAA_MO_GlobalVectorControl_GlobalVectorCommandType,
-    )
-
     test_cmd_writer = get_configurator().get_writer(
         UMAA_MO_GlobalVectorControl_GlobalVectorCommandType,
         profile_category=UmaaQosProfileCategory.COMMAND,
@@ -133,42 +125,22 @@ def test_50_destination_content_filter():
 
     test_status_reader.set_listener(status_listener, dds.StatusMask.DATA_AVAILABLE)
 
-    sleep(0.5)
+    wait_for_status(test_cmd_writer, dds.StatusMask.PUBLICATION_MATCHED)
+    wait_for_status(test_status_reader, dds.StatusMask.SUBSCRIPTION_MATCHED)
 
     gv_cmd = UMAA_MO_GlobalVectorControl_GlobalVectorCommandType()
     test_cmd_writer.write(gv_cmd)
 
-    sleep(1)
+    assert not status_listener.wait_for_samples(1, timeout=1.0)
 
-    assert len(status_listener.sample_list) == 0
-
-
-def test_51_new_commands_added_to_thread_pool():
-    reset_dds_participant()
-    sleep(1)
-
-    GlobalVectorControlCommandFactory(
-        UMAA_MO_GlobalVectorControl_GlobalVectorCommandAckReportType,
-        UMAA_MO_GlobalVectorControl_GlobalVectorCommandStatusType,
-        UMAA_MO_GlobalVectorControl_GlobalVectorExecutionStatusReportType,
-    )
-
-    global_vector_control_service_provider = CommandProvider(
-        _global_vector_control_source_id,
-        GlobalVectorControlCommandFactory(
-            UMAA_MO_GlobalVectorControl_GlobalVectorCommandAckReportType,
-            UMAA_MO_GlobalVectorControl_GlobalVectorCommandStatusType,
-            UMAA_MO_GlobalVectorControl_GlobalVectorExecutionStatusReportType,
-        ),
-        UMAA_MO_GlobalVectorControl_GlobalVectorCommandType,
-    )
 
+def test_51_new_commands_added_to_thread_pool(global_vector_provider, wait_for_status):
     test_cmd_writer = get_configurator().get_writer(
         UMAA_MO_GlobalVectorControl_GlobalVectorCommandType,
         profile_category=UmaaQosProfileCategory.COMMAND,
     )
 
-    sleep(0.5)
+    wait_for_status(test_cmd_writer, dds.StatusMask.PUBLICATION_MATCHED)
 
     gv_cmd = UMAA_MO_GlobalVectorControl_GlobalVectorCommandType()
     gv_cmd.destination = _global_vector_control_source_id
@@ -2,12 +2,13 @@ import pytest
 from typing import Optional
 from time import sleep
 import logging
-import rti.connextdds as dds
+
+dds = pytest.importorskip("rti.connextdds", reason="RTI Connext DDS not available")
 
 from umaapy import get_configurator, reset_dds_participant
 from umaapy.core.report_consumer import ReportConsumer, ReaderListenerEventType
 from umaapy.util.event_processor import Command, HIGH
-from umaapy.util.uuid_factory import *
+from umaapy.util.uuid_factory import build_identifier_type
 from umaapy.util.timestamp import Timestamp
 
 from umaapy.umaa_types import UMAA_SA_GlobalPoseStatus_GlobalPoseReportType as GlobalPoseReportType
@@ -1,13 +1,14 @@
 import pytest
-from typing import override
-from time import sleep
+from typing import List, override
 import logging
-import rti.connextdds as dds
+from concurrent.futures import Future
+
+dds = pytest.importorskip("rti.connextdds", reason="RTI Connext DDS not available")
 
 from umaapy import get_configurator, reset_dds_participant
 from umaapy.core.report_provider import ReportProvider, WriterListenerEventType
 from umaapy.util.event_processor import Command
-from umaapy.util.uuid_factory import *
+from umaapy.util.uuid_factory import build_identifier_type
 from umaapy.util.timestamp import Timestamp
 
 from umaapy.umaa_types import UMAA_Common_IdentifierType, UMAA_SA_GlobalPoseStatus_GlobalPoseReportType
@@ -18,11 +19,13 @@ pytestmark = pytest.mark.integration_vendor
 
 class TestCommand(Command):
     def __init__(self):
-        self.executed = False
+        self.done: Future = Future()
 
     @override
     def execute(self, *args, **kwargs):
-        self.executed = True
+        # Later publication-matched events must not try to resolve the future again
+        if not self.done.done():
+            self.done.set_result(True)
 
 
 def test_46_provider_accepts_source_id():
@@ -36,12 +39,11 @@ def test_46_provider_accepts_source_id():
     assert gpr._source_id == source_id
 
 
-def test_47_send_report():
+def test_47_send_report(wait_for_status):
     reset_dds_participant()
     source_id = build_identifier_type("cec418f0-32de-4aee-961d-9530e79869bd", "8ca7d105-5832-4a4b-bec2-a405ebd33e33")
 
     now = Timestamp.now()
-    sleep(0.5)
 
     gpr = ReportProvider(
         source_id,
@@ -54,9 +56,9 @@ def test_47_send_report():
     send_sample.position.geodeticLatitude = 47.654
     send_sample.position.geodeticLongitude = -122.6079
 
-    sleep(0.5)
+    wait_for_status(test_reader, dds.StatusMask.SUBSCRIPTION_MATCHED)
     gpr.publish(send_sample)
-    sleep(0.5)
+    wait_for_status(test_reader, dds.StatusMask.DATA_AVAILABLE)
 
     samples: List[UMAA_SA_GlobalPoseStatus_GlobalPoseReportType] = test_reader.take_data()
     assert len(samples) > 0
@@ -74,7 +76,6 @@ def test_48_writer_callbacks():
     test_command = TestCommand()
 
     gpr.add_event_callback(WriterListenerEventType.ON_PUBLICATION_MATCHED, test_command)
-    assert not test_command.executed
+    assert not test_command.done.done()
     gpr.on_publication_matched(None, dds.PublicationMatchedStatus)
-    sleep(1)
-    assert test_command.executed
+    assert test_command.done.result(timeout=1.0) is True
@@ -11,20 +11,22 @@ from umaapy.umaa_types import (
 
 pytestmark = pytest.mark.integration_vendor
 
+_QOS_FILE = str(files("umaapy.resource") / "umaapy_qos_lib.xml")
 
-def test_get_topic():
-    qos_file = str(files("umaapy.resource") / "umaapy_qos_lib.xml")
-    config_boy = DDSConfigurator(0, qos_file)
 
+@pytest.fixture(scope="module")
+def config_boy():
+    return DDSConfigurator(0, _QOS_FILE)
+
+
+def test_get_topic(config_boy):
     topic = config_boy.get_topic(UMAA_SA_GlobalPoseStatus_GlobalPoseReportType)
 
-    config_boy = DDSConfigurator(0, qos_file)
+    assert DDSConfigurator(0, _QOS_FILE) is config_boy
     assert topic is not None
 
 
-def test_load_reader_writer():
-    qos_file = str(files("umaapy.resource") / "umaapy_qos_lib.xml")
-    config_boy = DDSConfigurator(0, qos_file)
+def test_load_reader_writer(config_boy):
     gpr_reader = config_boy.get_reader(UMAA_SA_GlobalPoseStatus_GlobalPoseReportType)
     gpr_writer = config_boy.get_writer(UMAA_SA_GlobalPoseStatus_GlobalPoseReportType)
     gpr_writer.write(UMAA_SA_GlobalPoseStatus_GlobalPoseReportType())
@@ -32,9 +34,7 @@ def test_load_reader_writer():
     assert len(gpr_reader.read()) > 0
 
 
-def test_filtered_reader():
-    qos_file = str(files("umaapy.resource") / "umaapy_qos_lib.xml")
-    config_boy = DDSConfigurator(0, qos_file)
+def test_filtered_reader(config_boy):
     gpr_filtered_reader, _ = config_boy.get_filtered_reader(
         UMAA_SA_GlobalPoseStatus_GlobalPoseReportType, "depth = %0", ["42.0"]
     )
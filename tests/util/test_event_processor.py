@@ -1,9 +1,10 @@
 from typing import List
 
 import pytest
+import threading
 import time
 from concurrent.futures import TimeoutError
-from umaapy.util.event_processor import *
+from umaapy.util.event_processor import LOW, MEDIUM, Command, EventProcessor
 
 pytestmark = pytest.mark.unit
 
@@ -37,12 +38,15 @@ class TestEventProcessor:
     def test_recurring_task(self):
         assert self.ep.running()
         calls: List[float] = []
+        done = threading.Event()
 
         def recur(call_list: List[float]):
             call_list.append(time.time())
+            if len(call_list) >= 3:
+                done.set()
 
         tid = self.ep.submit_recurring(recur, 50, calls)
-        time.sleep(0.5)
+        assert done.wait(timeout=1.0)
         self.ep.cancel(tid)
         # Expect at least 3 calls (at 0ms, ~50ms, ~100ms, ~150ms)
         assert len(calls) >= 3
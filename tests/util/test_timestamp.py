@@ -77,3 +77,12 @@ def test_from_and_to_umaa():
     umaa_roundtrip = ts.to_umaa()
     assert umaa_roundtrip.seconds == 123
     assert umaa_roundtrip.nanoseconds == 456_789_000
+
+
+def test_to_umaa_returns_fresh_equivalent_instances():
+    ts = Timestamp(42, 123)
+    first = ts.to_umaa()
+    second = ts.to_umaa()
+    assert first == UMAA_Common_Measurement_DateTime(42, 123)
+    assert first is not second
+    assert Timestamp.from_umaa(first) == ts
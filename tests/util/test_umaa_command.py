@@ -0,0 +1,129 @@
+import logging
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from umaapy.util.umaa_command import UmaaCommand, UmaaCommandException
+
+from umaapy.umaa_types import (
+    UMAA_Common_IdentifierType as IdentifierType,
+    UMAA_MO_GlobalVectorControl_GlobalVectorCommandType as GlobalVectorCommandType,
+    UMAA_MO_GlobalVectorControl_GlobalVectorCommandAckReportType as GlobalVectorCommandAckReportType,
+    UMAA_MO_GlobalVectorControl_GlobalVectorCommandStatusType as GlobalVectorCommandStatusType,
+    UMAA_Common_MaritimeEnumeration_CommandStatusEnumModule_CommandStatusEnumType as CmdStatus,
+    UMAA_Common_MaritimeEnumeration_CommandStatusReasonEnumModule_CommandStatusReasonEnumType as CmdReason,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeWriter:
+    def __init__(self, data_type):
+        self.topic = SimpleNamespace(type=data_type)
+        self.samples = []
+        self.flushed_at = []
+
+    def write(self, sample):
+        self.samples.append(sample)
+
+    def lookup_instance(self, sample):
+        return None
+
+    def dispose_instance(self, handle):
+        pass
+
+    def flush(self):
+        self.flushed_at.append(len(self.samples))
+
+
+class CompletingCommand(UmaaCommand):
+    def on_executing(self) -> None:
+        pass
+
+
+class FailingCommand(UmaaCommand):
+    def on_executing(self) -> None:
+        raise UmaaCommandException(CmdReason.RESOURCE_FAILED, "boom")
+
+
+def _build_command(command_cls=UmaaCommand) -> UmaaCommand:
+    return command_cls(
+        IdentifierType(),
+        GlobalVectorCommandType(),
+        logging.getLogger(__name__),
+        FakeWriter(GlobalVectorCommandAckReportType),
+        FakeWriter(GlobalVectorCommandStatusType),
+    )
+
+
+def test_wait_for_predicate_already_satisfied():
+    cmd = _build_command()
+    assert cmd.wait_for(lambda: True, timeout=1.0) == (True, False)
+
+
+def test_wait_for_times_out():
+    cmd = _build_command()
+    start = time.monotonic()
+    assert cmd.wait_for(lambda: False, timeout=0.05) == (False, False)
+    assert time.monotonic() - start >= 0.05
+
+
+def test_wait_for_wakes_on_cancel():
+    cmd = _build_command()
+    threading.Timer(0.05, cmd.cancel).start()
+    assert cmd.wait_for(lambda: False, timeout=5.0) == (False, False)
+    assert cmd._cancelled
+
+
+def test_wait_for_wakes_on_update():
+    cmd = _build_command()
+    threading.Timer(0.05, cmd.update, args=(GlobalVectorCommandType(),)).start()
+    assert cmd.wait_for(lambda: False, timeout=5.0) == (False, True)
+
+
+def test_execute_publishes_lifecycle_statuses():
+    cmd = _build_command(CompletingCommand)
+    cmd.execute()
+    assert len(cmd._ack_writer.samples) == 1
+    assert [s.commandStatus for s in cmd._status_writer.samples] == [
+        CmdStatus.ISSUED,
+        CmdStatus.COMMANDED,
+        CmdStatus.EXECUTING,
+        CmdStatus.COMPLETED,
+    ]
+    # Flushed before on_commanded, before on_executing, and on the terminal stage
+    assert cmd._status_writer.flushed_at[:3] == [2, 3, 4]
+
+
+def test_execute_publishes_failed_status():
+    cmd = _build_command(FailingCommand)
+    cmd.execute()
+    failed = cmd._status_writer.samples[-1]
+    assert failed.commandStatus == CmdStatus.FAILED
+    assert failed.commandStatusReason == CmdReason.RESOURCE_FAILED
+    assert failed.logMessage == "boom"
+
+
+def test_terminal_stage_runs_when_flush_fails():
+    class ClosedWriter(FakeWriter):
+        def flush(self):
+            raise RuntimeError("writer closed")
+
+    terminal = []
+
+    class TerminalCommand(CompletingCommand):
+        def on_terminal(self) -> None:
+            terminal.append(True)
+
+    cmd = TerminalCommand(
+        IdentifierType(),
+        GlobalVectorCommandType(),
+        logging.getLogger(__name__),
+        FakeWriter(GlobalVectorCommandAckReportType),
+        ClosedWriter(GlobalVectorCommandStatusType),
+    )
+    cmd.execute()
+    assert terminal == [True]
+    assert cmd._status_writer.samples[-1].commandStatus == CmdStatus.COMPLETED
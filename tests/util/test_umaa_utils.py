@@ -0,0 +1,129 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from umaapy.core.command_consumer import CommandConsumer
+from umaapy.util.provider import Provider
+from umaapy.util.umaa_utils import (
+    HashableIdentifierType,
+    HashableNumericGUID,
+    UMAAConcept,
+    classify_obj_by_umaa,
+    classify_type_by_umaa,
+    make_instance_key_fn,
+    topic_from_type,
+    validate_umaa_obj,
+)
+from umaapy.util.uuid_factory import generate_guid
+
+from umaapy.umaa_types import (
+    UMAA_Common_IdentifierType as IdentifierType,
+    UMAA_MO_GlobalVectorControl_GlobalVectorCommandType as GlobalVectorCommandType,
+    UMAA_MO_GlobalVectorControl_GlobalVectorCommandAckReportType as GlobalVectorCommandAckReportType,
+    UMAA_MO_GlobalVectorControl_GlobalVectorCommandStatusType as GlobalVectorCommandStatusType,
+    UMAA_MM_MissionPlanReport_MissionPlanReportType as MissionPlanReportType,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_validate_umaa_obj_accepts_type():
+    assert validate_umaa_obj(GlobalVectorCommandAckReportType, UMAAConcept.ACKNOWLEDGEMENT)
+    assert not validate_umaa_obj(GlobalVectorCommandAckReportType, UMAAConcept.STATUS)
+    assert validate_umaa_obj(GlobalVectorCommandStatusType, UMAAConcept.STATUS)
+
+
+def test_validate_umaa_obj_type_matches_instance():
+    for concept in UMAAConcept:
+        assert validate_umaa_obj(GlobalVectorCommandStatusType, concept) == validate_umaa_obj(
+            GlobalVectorCommandStatusType(), concept
+        )
+
+
+def test_hashable_numeric_guid_hash_and_equality():
+    guid = generate_guid()
+    key = HashableNumericGUID(guid)
+    assert key == HashableNumericGUID(guid)
+    assert hash(key) == hash(HashableNumericGUID(guid))
+    assert key != HashableNumericGUID(generate_guid())
+    assert not hasattr(key, "__dict__")
+    assert key.to_umaa() == guid
+    assert {key: 1}[HashableNumericGUID(guid)] == 1
+    # Plain NumericGUIDs still compare equal to the wrapper
+    assert key == guid
+
+
+def test_hashable_identifier_type_hash_and_equality():
+    ident = IdentifierType(id=generate_guid(), parentID=generate_guid())
+    key = HashableIdentifierType(ident)
+    assert key == HashableIdentifierType(ident)
+    assert hash(key) == hash(HashableIdentifierType(ident))
+    assert hash(key) == hash((key.id, key.parentID))
+    assert key == ident
+    assert key != HashableIdentifierType(IdentifierType(id=generate_guid(), parentID=ident.parentID))
+
+
+def test_classify_obj_by_umaa_skips_primitive_fields():
+    cmap = classify_obj_by_umaa(MissionPlanReportType())
+    assert cmap[()].classifications == {UMAAConcept.REPORT}
+    assert UMAAConcept.LARGE_SET in cmap[("constraintsSetMetadata",)].classifications
+    # timeStamp is a plain struct with no UMAA concept; its int fields are never visited
+    assert ("timeStamp", "seconds") not in cmap
+
+
+def test_classify_type_by_umaa_is_cached_per_type():
+    cmap = classify_type_by_umaa(MissionPlanReportType)
+    assert classify_type_by_umaa(MissionPlanReportType) is cmap
+    assert cmap == classify_obj_by_umaa(MissionPlanReportType())
+
+
+def test_topic_from_type_is_memoized():
+    topic = topic_from_type(MissionPlanReportType)
+    assert topic == "UMAA::MM::MissionPlanReport::MissionPlanReportType"
+    assert topic_from_type(MissionPlanReportType) is topic
+
+
+def test_make_instance_key_fn_normalizes_and_skips_missing_fields():
+    source = generate_guid()
+    session = generate_guid()
+    sample = SimpleNamespace(source=source, sessionID=session, header=SimpleNamespace(destination=None))
+
+    key_fn = make_instance_key_fn(("sessionID", "source"))
+    assert key_fn(sample) == (HashableNumericGUID(session), HashableNumericGUID(source))
+    assert make_instance_key_fn(("source",))(sample) == (HashableNumericGUID(source),)
+    # Missing and None-valued fields are dropped from the key
+    assert make_instance_key_fn(("source", "destination", "header.destination"))(sample) == (
+        HashableNumericGUID(source),
+    )
+    assert make_instance_key_fn(())(sample) == ()
+
+
+def test_make_instance_key_fn_resolves_dotted_names_as_nested_paths():
+    session = generate_guid()
+    sample = SimpleNamespace(header=SimpleNamespace(sessionID=session))
+    setattr(sample, "header.sessionID", generate_guid())
+
+    # The nested header.sessionID wins over a literal attribute named "header.sessionID"
+    assert make_instance_key_fn(("header.sessionID",))(sample) == (HashableNumericGUID(session),)
+    assert make_instance_key_fn(("header.sessionID", "header.missing"))(sample) == (HashableNumericGUID(session),)
+
+
+def test_command_session_destination_is_plain_identifier_type():
+    # Bypass __init__ so no DDS entities are created; only the bookkeeping touched by create_command_session
+    consumer = CommandConsumer.__new__(CommandConsumer)
+    consumer.source_id = IdentifierType(id=generate_guid(), parentID=generate_guid())
+    consumer._logger = logging.getLogger(__name__)
+    consumer._execution_status_reader = None
+    consumer._providers_by_session = {}
+    consumer._update_content_filters = lambda: None
+    provider_id = IdentifierType(id=generate_guid(), parentID=generate_guid())
+    provider = Provider(source=HashableIdentifierType(provider_id))
+    consumer._providers_by_source = {provider.source: provider}
+
+    # Callers may hand back Provider.source (the hashable key) as the target
+    command = GlobalVectorCommandType()
+    session = consumer.create_command_session(command, provider.source)
+    assert session is not None
+    assert type(command.destination) is IdentifierType
+    assert command.destination == provider_id
@@ -1,7 +1,18 @@
 from xml.dom.minidom import Identified
+import uuid
+
 import pytest
 
-from umaapy.util.uuid_factory import *
+from umaapy.util.uuid_factory import (
+    NIL_GUID,
+    build_identifier_type,
+    generate_guid,
+    guid_from_string,
+    guid_to_hex,
+    nil_guid,
+)
+
+from umaapy.umaa_types import UMAA_Common_IdentifierType, UMAA_Common_Measurement_NumericGUID
 
 pytestmark = pytest.mark.unit
 
@@ -15,6 +26,17 @@ def test_guid_to_hex():
 def test_generate_guid():
     rand_id: UMAA_Common_Measurement_NumericGUID = generate_guid()
     assert NIL_GUID != rand_id
+    parsed = uuid.UUID(bytes=bytes(rand_id.value))
+    assert parsed.version == 4
+    assert parsed.variant == uuid.RFC_4122
+
+
+def test_nil_guid_is_a_fresh_copy():
+    nil = nil_guid()
+    assert nil == NIL_GUID
+    assert nil is not NIL_GUID
+    nil.value[0] = 1
+    assert bytes(NIL_GUID.value) == bytes(16)
 
 
 def test_guid_from_string():